@@ -0,0 +1,86 @@
+"""Bronze step: raw landing CSV files appended as Parquet parts.
+
+Mirrors the bronze notebook. The landing folder is walked once, files not in
+the manifest are read with Arrow's multithreaded CSV reader and each one is
+written unchanged as its own Parquet part, one file per worker process.
+``ingestion_timestamp`` is kept when the file carries it (the monthly
+snapshots do) and is otherwise the run timestamp, like ``current_timestamp``
+in the notebook.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+from manifest import FileManifest, list_landing_files
+
+BRONZE_TABLE = "hr_bronze_data"
+TIMESTAMP_TYPE = pa.timestamp("us")
+
+
+def part_name(path: str) -> str:
+    """Bronze part for a landing file, e.g. ``2025/10/snapshot_2025_10.csv`` -> ``2025__10__snapshot_2025_10.parquet``."""
+    return path.removesuffix(".csv").replace("/", "__") + ".parquet"
+
+
+def ingest_file(landing: Path, path: str, table_dir: Path, run_timestamp: datetime) -> dict:
+    """Write one landing file as a bronze part and return its manifest entry."""
+    # Empty fields are nulls, as Spark reads them, not empty strings
+    table = pv.read_csv(
+        Path(landing) / path, convert_options=pv.ConvertOptions(strings_can_be_null=True)
+    )
+    if "ingestion_timestamp" in table.column_names:
+        position = table.column_names.index("ingestion_timestamp")
+        column = table.column(position)
+        # The snapshots write plain 'YYYY-MM-DD' strings; Arrow may infer a date or keep text
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            column = pc.strptime(column, format="%Y-%m-%d", unit="us")
+        table = table.set_column(position, "ingestion_timestamp", column.cast(TIMESTAMP_TYPE))
+    else:
+        table = table.append_column(
+            "ingestion_timestamp", pa.array([run_timestamp] * table.num_rows, TIMESTAMP_TYPE)
+        )
+
+    part = part_name(path)
+    pq.write_table(table, Path(table_dir) / part)
+    return {
+        "path": path,
+        "rows": table.num_rows,
+        "bronze_part": part,
+        "max_ingestion_timestamp": pc.max(table.column("ingestion_timestamp")).as_py(),
+    }
+
+
+def run_bronze(landing: Path, bronze_dir: Path, workers: int = None) -> FileManifest:
+    """Ingest the new landing files and return the updated manifest."""
+    bronze_dir = Path(bronze_dir)
+    table_dir = bronze_dir / BRONZE_TABLE
+    table_dir.mkdir(parents=True, exist_ok=True)
+    manifest = FileManifest(bronze_dir / "ingested_files.parquet")
+
+    new_files = manifest.new_files(list_landing_files(landing))
+    if new_files.empty:
+        print("Bronze: no new files to ingest.")
+        return manifest
+
+    run_timestamp = datetime.now()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        entries = list(
+            pool.map(
+                ingest_file,
+                [landing] * len(new_files),
+                new_files["path"],
+                [table_dir] * len(new_files),
+                [run_timestamp] * len(new_files),
+            )
+        )
+
+    manifest.record(new_files.merge(pd.DataFrame(entries), on="path"))
+    print(f"Bronze: ingested {len(new_files)} new files ({sum(e['rows'] for e in entries):,} rows).")
+    return manifest
@@ -0,0 +1,189 @@
+"""Gold step: the silver rows as a star schema of six dimensions and one fact table.
+
+Mirrors the gold notebook. The notebook updates each dimension in turn (a
+distinct, an anti join, a ``row_number`` window and a join back per column);
+here every dimension column of the new fact rows is stacked into one
+(dimension, name) frame, so the names not seen before are found and numbered
+for all six dimensions in a single pass. New names are numbered in name
+order after the dimension's current maximum id, as in the notebook.
+
+Dimensions are small and rewritten on every run; the fact table is appended
+as one Parquet part per run. Each part records the exact silver
+``ingestion_timestamp`` it reaches in its Parquet metadata: the fact column
+is a date, so it cannot tell a later run which rows of that day it already has.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from silver import SILVER_TABLE, WATERMARK_KEY
+
+FACT_TABLE = "fact_table_gold_hr_data"
+
+DIM_MAPPING = {
+    "department": "dim_department_gold",
+    "job_title": "dim_job_title_gold",
+    "location": "dim_location_gold",
+    "status": "dim_status_gold",
+    "work_mode": "dim_work_mode_gold",
+    "job_level": "dim_job_level_gold",
+}
+
+JOB_LEVEL_ORDER = {"Specialist": 1, "Analyst": 2, "Manager": 3, "Principal": 4, "Executive": 5}
+
+# The notebook's fallback for rows without a job level
+DEFAULT_JOB_LEVEL_ID = 5
+
+FACT_SCHEMA = pa.schema(
+    [
+        ("employee_id", pa.string()),
+        ("full_name", pa.string()),
+        ("department_id", pa.int32()),
+        ("job_title_id", pa.int32()),
+        ("hire_date", pa.date32()),
+        ("location_id", pa.int32()),
+        ("performance_rating", pa.int32()),
+        ("experience_years", pa.int32()),
+        ("status_id", pa.int32()),
+        ("work_mode_id", pa.int32()),
+        ("annual_salary", pa.float64()),
+        ("job_level_id", pa.int32()),
+        ("ingestion_timestamp", pa.date32()),
+        ("data_hash", pa.string()),
+        ("start_effectivity_date", pa.timestamp("us")),
+        ("end_effectivity_date", pa.timestamp("us")),
+        ("is_active", pa.bool_()),
+    ]
+)
+
+
+def _write_atomic(table: pa.Table, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_dimensions(gold_dir: Path) -> pd.DataFrame:
+    """All dimension rows stacked as (dimension, id, name)."""
+    frames = [
+        pd.read_parquet(path, columns=["id", "name"]).assign(dimension=col)
+        for col, table in DIM_MAPPING.items()
+        if (path := Path(gold_dir) / f"{table}.parquet").exists()
+    ]
+    if not frames:
+        return pd.DataFrame({"dimension": pd.Series(dtype=object), "id": pd.Series(dtype="int32"),
+                             "name": pd.Series(dtype=object)})
+    return pd.concat(frames, ignore_index=True)[["dimension", "id", "name"]]
+
+
+def assign_dimension_ids(fact: pd.DataFrame, dims: pd.DataFrame):
+    """Number the new names of every dimension and replace the fact columns with ids.
+
+    Returns the updated stacked dimensions and the fact with ``<column>_id`` columns.
+    """
+    seen = (
+        fact[list(DIM_MAPPING)]
+        .melt(var_name="dimension", value_name="name")
+        .dropna()
+        .drop_duplicates()
+    )
+    seen = seen.merge(dims[["dimension", "name"]], how="left", indicator=True)
+    new = seen[seen["_merge"] == "left_only"].sort_values(["dimension", "name"])
+    max_ids = dims.groupby("dimension")["id"].max()
+    new_ids = (
+        new.groupby("dimension").cumcount().to_numpy() + 1
+        + new["dimension"].map(max_ids).fillna(0).to_numpy(dtype="int64")
+    )
+    dims = pd.concat(
+        [dims, new[["dimension", "name"]].assign(id=new_ids)[["dimension", "id", "name"]]],
+        ignore_index=True,
+    ).astype({"id": "int32"})
+
+    fact = fact.copy()
+    for col in DIM_MAPPING:
+        dim = dims[dims["dimension"] == col]
+        position = pd.Index(dim["name"]).get_indexer(fact[col])
+        # -1 (a null or unknown name) becomes a null id, like the notebook's left join
+        fact[f"{col}_id"] = pd.array(dim["id"].to_numpy(), dtype="Int32").take(position, allow_fill=True)
+    fact["job_level_id"] = fact["job_level_id"].fillna(DEFAULT_JOB_LEVEL_ID)
+    return dims, fact
+
+
+def _fact_watermark(parts: list):
+    """Latest silver ``ingestion_timestamp`` appended, read from the parts' metadata."""
+    if not parts:
+        return None
+    return max(
+        pd.Timestamp(pq.read_schema(part).metadata[WATERMARK_KEY].decode()) for part in parts
+    )
+
+
+def run_gold(silver_dir: Path, gold_dir: Path):
+    """Append the silver rows newer than the fact watermark and update the dimensions."""
+    gold_dir = Path(gold_dir)
+    fact_dir = gold_dir / FACT_TABLE
+    fact_parts = sorted(fact_dir.glob("*.parquet"))
+    watermark = _fact_watermark(fact_parts)
+
+    silver_path = Path(silver_dir) / f"{SILVER_TABLE}.parquet"
+    if not silver_path.exists():
+        print("Gold: no silver table yet.")
+        return
+    filters = None if watermark is None else [("ingestion_timestamp", ">", watermark)]
+    fact = pq.read_table(silver_path, filters=filters).to_pandas()
+    if fact.empty:
+        print("Gold: no new silver rows.")
+        return
+
+    dims, fact = assign_dimension_ids(fact, load_dimensions(gold_dir))
+    for col, table in DIM_MAPPING.items():
+        dim = dims[dims["dimension"] == col][["id", "name"]]
+        if col == "job_level":
+            dim = dim.assign(job_level_order=dim["name"].map(JOB_LEVEL_ORDER).astype("Int32"))
+        _write_atomic(pa.Table.from_pandas(dim, preserve_index=False), gold_dir / f"{table}.parquet")
+
+    # Timestamps are cast down to the notebook's date columns here, and the
+    # numeric silver columns to int32; an unsafe cast truncates like Spark's
+    fact_table = pa.Table.from_pandas(fact[FACT_SCHEMA.names], preserve_index=False)
+    fact_table = fact_table.cast(FACT_SCHEMA, safe=False)
+    fact_table = fact_table.replace_schema_metadata(
+        {**(fact_table.schema.metadata or {}),
+         WATERMARK_KEY: fact["ingestion_timestamp"].max().isoformat().encode()}
+    )
+    part = fact_dir / f"part-{len(fact_parts):05d}.parquet"
+    _write_atomic(fact_table, part)
+    print(f"Gold: appended {len(fact):,} fact rows to {part.name}.")
+
+
+def latest_per_employee(gold_dir: Path) -> pd.DataFrame:
+    """The dashboard's warehouse query over the local star schema.
+
+    One row per employee (latest hire date, then latest ingestion), with the
+    dimension names joined back and the columns named as in ``HR_QUERY``.
+    """
+    gold_dir = Path(gold_dir)
+    fact = pq.read_table(gold_dir / FACT_TABLE).to_pandas(date_as_object=False)
+    fact = fact.sort_values(
+        ["employee_id", "hire_date", "ingestion_timestamp"], ascending=[True, False, False]
+    ).drop_duplicates("employee_id")
+
+    dims = load_dimensions(gold_dir)
+    for col in DIM_MAPPING:
+        names = dims[dims["dimension"] == col].set_index("id")["name"]
+        fact[col] = fact[f"{col}_id"].map(names)
+
+    renames = {
+        "department": "Department", "job_title": "Job_Title", "hire_date": "Hire_Date",
+        "location": "Location", "performance_rating": "Performance_Rating",
+        "experience_years": "Experience_Years", "status": "Status", "work_mode": "Work_Mode",
+        "annual_salary": "Salary_INR", "job_level": "Job_Level",
+        "department_id": "Department_ID", "job_title_id": "Job_Title_ID",
+        "location_id": "Location_ID", "status_id": "Status_ID", "work_mode_id": "Work_Mode_ID",
+        "job_level_id": "Job_Level_ID", "ingestion_timestamp": "Ingestion_Timestamp",
+    }
+    return fact[["employee_id", "full_name", *renames]].rename(columns=renames).reset_index(drop=True)
@@ -0,0 +1,37 @@
+"""Vectorized ``assign_job_level`` from the dataset snapshots notebook.
+
+The notebook applies a Python function row by row. The same rules as one
+``np.select`` over whole columns:
+
+- the executive titles are ``Executive``;
+- otherwise Experience_Years <= 3 is ``Specialist``, <= 8 ``Analyst``,
+  <= 11 ``Manager`` and anything else (including missing) ``Principal``.
+"""
+
+import numpy as np
+import pandas as pd
+
+EXECUTIVE_TITLES = ["CTO", "CFO", "HR Director", "Operations Director", "Sales Director"]
+
+# Experience_Years percentiles fixed in the notebook
+P25 = 3
+P50 = 8
+P75 = 11
+
+
+def assign_job_level(job_title: pd.Series, experience_years: pd.Series) -> pd.Series:
+    """Job_Level for every row, identical to the notebook's row-wise function."""
+    experience = pd.to_numeric(experience_years, errors="coerce").to_numpy(dtype="float64")
+    # NaN comparisons are False, so missing experience falls through to Principal
+    # exactly like the chained ``elif`` in the notebook
+    levels = np.select(
+        [
+            job_title.isin(EXECUTIVE_TITLES).to_numpy(),
+            experience <= P25,
+            experience <= P50,
+            experience <= P75,
+        ],
+        ["Executive", "Specialist", "Analyst", "Manager"],
+        default="Principal",
+    )
+    return pd.Series(levels, index=job_title.index, name="Job_Level", dtype=object)
@@ -0,0 +1,76 @@
+"""Compact manifest of the landing files already ingested into bronze.
+
+Replaces the bronze notebook's ``metadata.txt`` (a newline-separated path
+list read with ``dbutils.fs.head`` and rewritten in full on every run) with a
+small Parquet table holding one row per ingested file: its relative path,
+size, modification time, row count, the bronze part it was written to and
+the latest ``ingestion_timestamp`` it contained. The silver step uses that
+last column to read only the bronze parts that can hold new rows.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+MANIFEST_COLUMNS = {
+    "path": "object",
+    "size": "int64",
+    "mtime_ns": "int64",
+    "rows": "int64",
+    "bronze_part": "object",
+    "max_ingestion_timestamp": "datetime64[us]",
+}
+
+
+def list_landing_files(root: Path, suffix: str = ".csv") -> pd.DataFrame:
+    """Every ``suffix`` file under ``root`` (the ``year/month`` folders), with size and mtime."""
+    records = []
+    stack = [Path(root)]
+    # One scandir per directory; the stat results come with the listing
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(Path(entry.path))
+                elif entry.name.endswith(suffix):
+                    stat = entry.stat()
+                    records.append(
+                        (Path(entry.path).relative_to(root).as_posix(), stat.st_size, stat.st_mtime_ns)
+                    )
+    files = pd.DataFrame(records, columns=["path", "size", "mtime_ns"])
+    return files.sort_values("path", ignore_index=True)
+
+
+class FileManifest:
+    """Parquet-backed record of ingested landing files."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        if self.path.exists():
+            self.files = pd.read_parquet(self.path)
+        else:
+            self.files = pd.DataFrame(
+                {col: pd.Series(dtype=dtype) for col, dtype in MANIFEST_COLUMNS.items()}
+            )
+
+    def new_files(self, landing: pd.DataFrame) -> pd.DataFrame:
+        """Landing files whose path has not been ingested yet."""
+        return landing[~landing["path"].isin(self.files["path"])].reset_index(drop=True)
+
+    def record(self, entries: pd.DataFrame):
+        """Add ``entries`` and atomically rewrite the manifest."""
+        self.files = pd.concat(
+            [self.files, entries[list(MANIFEST_COLUMNS)]], ignore_index=True
+        ).astype(MANIFEST_COLUMNS)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self.files.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self.path)
+
+    def parts_after(self, watermark) -> list:
+        """Bronze parts that may hold rows ingested after ``watermark``."""
+        files = self.files
+        if watermark is not None:
+            files = files[files["max_ingestion_timestamp"] > watermark]
+        return files["bronze_part"].tolist()
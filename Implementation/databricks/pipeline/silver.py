@@ -0,0 +1,212 @@
+"""Silver step: cleaned bronze rows merged into a type 2 slowly changing table.
+
+Mirrors the silver notebook: auxiliary snapshot columns are dropped, columns
+renamed to snake_case, ``data_hash`` is the SHA-256 of the tracked columns
+joined with ``_`` (nulls skipped, as ``concat_ws`` does) and the table keeps
+one active row per employee plus the closed history. Numeric columns keep the
+type bronze inferred and are rendered for the hash as Spark casts them to
+string (a double rating is ``5.0``); gold casts them to integers.
+
+Instead of two Delta MERGEs over every new bronze row at once, the new rows
+are merged one snapshot (``ingestion_timestamp``) at a time, oldest first,
+with an index lookup of the active rows:
+
+- a known employee whose hash changed closes the active row and inserts the new one;
+- an employee not seen before is inserted;
+- an active employee missing from the snapshot is closed.
+
+Closed rows get the snapshot's ``ingestion_timestamp`` as their
+``end_effectivity_date`` (the notebook uses the merge wall-clock time), so
+backfilling many months in one run gives the same table as running monthly.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bronze import BRONZE_TABLE
+from manifest import FileManifest
+
+SILVER_TABLE = "hr_silver_data"
+
+# Latest snapshot merged, kept in the Parquet metadata: a snapshot without any
+# change adds no rows, so the table's own max(ingestion_timestamp) can lag behind
+WATERMARK_KEY = b"silver_watermark"
+
+AUXILIARY_COLUMNS = [
+    "snapshot_date", "time_in_company", "previous_job_level",
+    "last_raise_year", "month", "promotion_count",
+]
+
+RENAMES = {
+    "Employee_ID": "employee_id",
+    "Full_Name": "full_name",
+    "Department": "department",
+    "Job_Title": "job_title",
+    "Hire_Date": "hire_date",
+    "Location": "location",
+    "Performance_Rating": "performance_rating",
+    "Experience_Years": "experience_years",
+    "Status": "status",
+    "Work_Mode": "work_mode",
+    "Annual_Salary": "annual_salary",
+    "Job_Level": "job_level",
+}
+
+SILVER_COLUMNS = [
+    "employee_id", "full_name", "department", "job_title", "hire_date", "location",
+    "performance_rating", "experience_years", "status", "work_mode", "annual_salary",
+    "job_level", "ingestion_timestamp",
+]
+
+TRACKED_COLUMNS = [
+    "employee_id", "full_name", "department", "job_title", "location",
+    "performance_rating", "status", "work_mode", "job_level",
+]
+
+
+def _double_string(value: float) -> str:
+    """Java's ``Double.toString``, which Spark uses to cast a double to string."""
+    if np.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value == 0 or 1e-3 <= abs(value) < 1e7:
+        return repr(float(value))
+    mantissa, exponent = np.format_float_scientific(value, unique=True, trim="0").split("e")
+    return f"{mantissa}E{int(exponent)}"
+
+
+def _spark_string(values: pd.Series) -> pd.Series:
+    """``values`` as Spark's ``cast(... as string)`` renders them, nulls kept."""
+    if not pd.api.types.is_float_dtype(values.dtype):
+        return values.astype("string")
+    # Few distinct values: render each once
+    codes, uniques = pd.factorize(values)
+    rendered = pd.array([_double_string(value) for value in uniques], dtype="string")
+    return pd.Series(rendered.take(codes, allow_fill=True), index=values.index)
+
+
+def data_hash(df: pd.DataFrame) -> pd.Series:
+    """``sha2(concat_ws('_', *TRACKED_COLUMNS), 256)`` for every row."""
+    joined = None
+    for col in TRACKED_COLUMNS:
+        text = _spark_string(df[col])
+        # concat_ws skips nulls instead of nulling the whole string
+        joined = text if joined is None else (joined + "_" + text).fillna(joined).fillna(text)
+    return pd.Series(
+        [hashlib.sha256(value.encode()).hexdigest() for value in joined.fillna("").to_numpy(dtype=object)],
+        index=df.index,
+        dtype=object,
+    )
+
+
+def prepare_part(part: Path, watermark=None) -> pd.DataFrame:
+    """Bronze rows of ``part`` newer than ``watermark`` in the silver layout, hashed."""
+    filters = None if watermark is None else [("ingestion_timestamp", ">", watermark)]
+    table = pq.read_table(part, filters=filters)
+    # Integer columns with nulls stay integers, so the hash renders them as Spark does
+    df = table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+    df = df.drop(columns=AUXILIARY_COLUMNS, errors="ignore").rename(columns=RENAMES)
+
+    # A missing level stays null, as in the notebook; gold maps it to DEFAULT_JOB_LEVEL_ID
+    if "job_level" not in df.columns:
+        df["job_level"] = None
+
+    df = df[SILVER_COLUMNS].copy()
+    df["hire_date"] = pd.to_datetime(df["hire_date"], format="ISO8601", utc=True).dt.tz_localize(None)
+    df["annual_salary"] = df["annual_salary"].astype("float64")
+    df["data_hash"] = data_hash(df)
+    return df
+
+
+class SCD2Table:
+    """Silver rows split into the active row per employee and closed history."""
+
+    def __init__(self, frame: pd.DataFrame = None):
+        if frame is None or frame.empty:
+            self.active = None
+            self.closed = []
+        else:
+            is_active = frame["is_active"].to_numpy(dtype=bool)
+            self.active = frame[is_active].reset_index(drop=True)
+            self.closed = [frame[~is_active]]
+
+    def merge(self, batch: pd.DataFrame, batch_timestamp):
+        """Apply one snapshot of prepared rows."""
+        batch = batch.drop_duplicates("employee_id", keep="last").assign(
+            start_effectivity_date=batch["ingestion_timestamp"],
+            end_effectivity_date=pd.Series(pd.NaT, index=batch.index, dtype="datetime64[us]"),
+            is_active=True,
+        )
+        if self.active is None:
+            self.active = batch.reset_index(drop=True)
+            return
+
+        active_ids = pd.Index(self.active["employee_id"])
+        position = active_ids.get_indexer(batch["employee_id"])
+        known = position >= 0
+        changed = known.copy()
+        changed[known] = (
+            self.active["data_hash"].to_numpy()[position[known]]
+            != batch["data_hash"].to_numpy()[known]
+        )
+
+        # Close departed employees (no row in the snapshot) and changed ones
+        close = np.ones(len(active_ids), dtype=bool)
+        close[position[known & ~changed]] = False
+        if close.any():
+            self.closed.append(
+                self.active[close].assign(is_active=False, end_effectivity_date=batch_timestamp)
+            )
+        self.active = pd.concat(
+            [self.active[~close], batch[changed | ~known]], ignore_index=True
+        )
+
+    def frame(self) -> pd.DataFrame:
+        """All rows, history first."""
+        parts = self.closed + ([] if self.active is None else [self.active])
+        return pd.concat(parts, ignore_index=True)
+
+
+def run_silver(bronze_dir: Path, silver_dir: Path, manifest: FileManifest, workers: int = None):
+    """Merge the bronze rows newer than the silver watermark into silver."""
+    silver_path = Path(silver_dir) / f"{SILVER_TABLE}.parquet"
+    silver, watermark = None, None
+    if silver_path.exists():
+        table = pq.read_table(silver_path)
+        silver = table.to_pandas()
+        watermark = pd.Timestamp((table.schema.metadata or {})[WATERMARK_KEY].decode())
+
+    parts = [Path(bronze_dir) / BRONZE_TABLE / part for part in manifest.parts_after(watermark)]
+    if not parts:
+        print("Silver: no new bronze rows.")
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        new_rows = pd.concat(pool.map(prepare_part, parts, [watermark] * len(parts)), ignore_index=True)
+    if new_rows.empty:
+        print("Silver: no new bronze rows.")
+        return
+
+    scd2 = SCD2Table(silver)
+    for batch_timestamp, batch in new_rows.groupby("ingestion_timestamp", sort=True):
+        scd2.merge(batch, batch_timestamp)
+
+    merged = scd2.frame()
+    table = pa.Table.from_pandas(merged, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}),
+         WATERMARK_KEY: new_rows["ingestion_timestamp"].max().isoformat().encode()}
+    )
+    silver_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = silver_path.with_name(f"{silver_path.name}.{os.getpid()}.tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, silver_path)
+    print(
+        f"Silver: merged {len(new_rows):,} rows from {new_rows['ingestion_timestamp'].nunique()} "
+        f"snapshots ({int(merged['is_active'].sum()):,} active of {len(merged):,})."
+    )
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+SAMPLE_CSV = Path(__file__).resolve().parents[3] / "data" / "landing" / "initial_dataset_sample.csv"
+
+
+@pytest.fixture(scope="session")
+def sample() -> pd.DataFrame:
+    """First rows of the bundled sample, with the snapshot CSV columns."""
+    df = pd.read_csv(SAMPLE_CSV, index_col=0, nrows=200)
+    return df.rename(columns={"Salary_INR": "Annual_Salary"})
+
+
+def write_snapshot(landing: Path, df: pd.DataFrame, date: str, with_timestamp: bool = True) -> Path:
+    """Write ``df`` as the ``YYYY/MM/snapshot_YYYY_MM.csv`` file of ``date``."""
+    day = pd.Timestamp(date)
+    snapshot = df.assign(month=day.month, promotion_count=0, snapshot_date=date)
+    if with_timestamp:
+        snapshot = snapshot.assign(ingestion_timestamp=date)
+    path = Path(landing) / f"{day:%Y}" / f"{day:%m}" / f"snapshot_{day:%Y_%m}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    snapshot.to_csv(path, index=False)
+    return path
@@ -0,0 +1,102 @@
+"""Rerunning the pipeline must only process what landed since the last run."""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bronze import run_bronze
+from conftest import write_snapshot
+from gold import DEFAULT_JOB_LEVEL_ID, FACT_TABLE, load_dimensions, run_gold
+from silver import SILVER_TABLE, TRACKED_COLUMNS, data_hash, run_silver
+
+
+def run_pipeline(landing: Path, lakehouse: Path) -> pd.DataFrame:
+    """Run the three steps and return the whole fact table."""
+    manifest = run_bronze(landing, lakehouse / "bronze", workers=1)
+    run_silver(lakehouse / "bronze", lakehouse / "silver", manifest, workers=1)
+    run_gold(lakehouse / "silver", lakehouse / "gold")
+    return pd.read_parquet(lakehouse / "gold" / FACT_TABLE)
+
+
+def test_rerun_appends_no_fact_rows(tmp_path, sample):
+    landing, lakehouse = tmp_path / "landing", tmp_path / "lakehouse"
+    write_snapshot(landing, sample, "2025-10-01")
+    changed = sample.copy()
+    changed.loc[changed.index[:20], "Department"] = "Legal"
+    write_snapshot(landing, changed, "2025-11-01")
+    first = run_pipeline(landing, lakehouse)
+
+    # Without the column, bronze stamps the file with the run time
+    resigning = changed.index[changed["Status"] != "Resigned"][:10]
+    changed.loc[resigning, "Status"] = "Resigned"
+    write_snapshot(landing, changed, "2025-12-01", with_timestamp=False)
+    second = run_pipeline(landing, lakehouse)
+    assert len(second) == len(first) + 10
+
+    rerun = run_pipeline(landing, lakehouse)
+    pd.testing.assert_frame_equal(rerun, second)
+    assert len(list((lakehouse / "gold" / FACT_TABLE).glob("*.parquet"))) == 2
+
+
+def test_empty_fields_land_as_null(tmp_path, sample):
+    landing, lakehouse = tmp_path / "landing", tmp_path / "lakehouse"
+    write_snapshot(landing, sample, "2025-10-01")
+    run_pipeline(landing, lakehouse)
+    dims = load_dimensions(lakehouse / "gold")
+
+    changed = sample.copy()
+    changed.loc[changed.index[0], ["Department", "Job_Level"]] = np.nan
+    write_snapshot(landing, changed, "2025-11-01")
+    fact = run_pipeline(landing, lakehouse)
+    pd.testing.assert_frame_equal(load_dimensions(lakehouse / "gold"), dims)
+
+    employee = changed.iloc[0]["Employee_ID"]
+    row = fact[(fact["employee_id"] == employee) & fact["department_id"].isna()]
+    assert row["job_level_id"].tolist() == [DEFAULT_JOB_LEVEL_ID]
+
+    silver = pd.read_parquet(lakehouse / "silver" / f"{SILVER_TABLE}.parquet")
+    current = silver[(silver["employee_id"] == employee) & silver["department"].isna()]
+    assert current["job_level"].isna().all()
+    # concat_ws skips both nulls
+    parts = [
+        None if pd.isna(value) else str(value)
+        for value in current.iloc[0][TRACKED_COLUMNS].tolist()
+    ]
+    assert current["data_hash"].tolist() == [
+        hashlib.sha256("_".join(p for p in parts if p is not None).encode()).hexdigest()
+    ]
+
+
+@pytest.mark.parametrize(
+    "rating, rendered",
+    [
+        (pd.array([5.0], dtype="float64"), "5.0"),
+        (pd.array([4.5], dtype="float64"), "4.5"),
+        (pd.array([5], dtype="Int64"), "5"),
+        (pd.array([1e7], dtype="float64"), "1.0E7"),
+        (pd.array([np.nan], dtype="float64"), None),
+    ],
+)
+def test_data_hash_renders_numbers_like_spark(rating, rendered):
+    row = pd.DataFrame({col: [col] for col in TRACKED_COLUMNS}).assign(performance_rating=rating)
+    parts = [rendered if col == "performance_rating" else col for col in TRACKED_COLUMNS]
+    # concat_ws skips the null
+    expected = hashlib.sha256("_".join(p for p in parts if p is not None).encode()).hexdigest()
+    assert data_hash(row).tolist() == [expected]
+
+
+def test_gold_truncates_numbers_silver_keeps(tmp_path, sample):
+    landing, lakehouse = tmp_path / "landing", tmp_path / "lakehouse"
+    snapshot = sample.head(3).assign(
+        Performance_Rating=[4.7, 2.5, np.nan], Experience_Years=[3.9, 10.0, 0.5]
+    )
+    write_snapshot(landing, snapshot, "2025-10-01")
+    fact = run_pipeline(landing, lakehouse).sort_values("employee_id")
+
+    silver = pd.read_parquet(lakehouse / "silver" / f"{SILVER_TABLE}.parquet")
+    assert silver["performance_rating"].tolist()[:2] == [4.7, 2.5]
+    assert fact["performance_rating"].fillna(-1).tolist() == [4, 2, -1]
+    assert fact["experience_years"].tolist() == [3, 10, 0]
@@ -0,0 +1,808 @@
+# --------------------------------------------------------------------------------- IMPORT LIBARIES
+
+import logging
+import os
+from dash import Dash, dcc, html, Input, Output
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from dotenv import load_dotenv
+from flask import Response
+
+from callback_metrics import CallbackMetrics
+from data_sources import CsvSource, WarehouseSource, load_hr_data
+from density import density_grid, fit_line
+from figure_cache import FigureCache
+from hr_dataset import DatasetRefresher, HRDataset, LiveDataset
+from pushdown import PushdownEngine
+from shared_dataset import AttachedDataset
+
+# --------------------------------------------------------------------------------- LOAD .env VARAIBLES
+
+# Load environment variables
+load_dotenv()
+
+logging.basicConfig(level=logging.INFO)
+
+# --------------------------------------------------------------------------------- GET DATA
+
+# HR_QUERY_MODE=memory (default) loads the employee rows into the app;
+# HR_QUERY_MODE=pushdown sends each callback's GROUP BY to the gold schema
+# (an in-memory SQLite copy of the sample CSV when HR_DATA_SOURCE=csv).
+HR_QUERY_MODE = os.getenv("HR_QUERY_MODE", "memory").lower()
+
+if HR_QUERY_MODE == "pushdown":
+    live = None
+    if os.getenv("HR_DATA_SOURCE", "auto").lower() == "csv":
+        engine = PushdownEngine.for_sqlite(CsvSource().load())
+    else:
+        engine = PushdownEngine.for_warehouse(WarehouseSource())
+elif HR_QUERY_MODE == "memory" and os.getenv("HR_SHARED_DATASET"):
+    # Worker started by serve.py: map the dataset the parent process published
+    # and follow its refreshes instead of loading and refreshing a private copy
+    live = AttachedDataset(os.environ["HR_SHARED_DATASET"])
+elif HR_QUERY_MODE == "memory":
+    # Snapshot cache first, then the Databricks warehouse, then the bundled sample
+    # CSV (see data_sources.py for the HR_DATA_SOURCE / HR_CACHE_* settings)
+    df = load_hr_data()
+
+    # Clean, dictionary-encode dimensions, index rows per dimension value and
+    # pre-aggregate once so callbacks scale with the number of groups, not rows.
+    # Callbacks read ``live.current`` once so a refresh never mixes two versions.
+    live = LiveDataset(HRDataset.build(df))
+    del df
+
+    # Background refresh of rows ingested after the current watermark
+    HR_REFRESH_SECONDS = float(os.getenv("HR_REFRESH_SECONDS", "900"))
+    if HR_REFRESH_SECONDS > 0:
+        DatasetRefresher(live, WarehouseSource(), HR_REFRESH_SECONDS).start()
+else:
+    raise ValueError(f"Unknown HR_QUERY_MODE: {HR_QUERY_MODE}")
+
+# Serialized callback outputs per input combination. In memory mode they are
+# dropped on every dataset swap; pushdown results expire with the query cache.
+figures = FigureCache(
+    max_entries=int(os.getenv("HR_FIGURE_CACHE_SIZE", "256")),
+    ttl_seconds=engine.cache.ttl_seconds if live is None else None,
+)
+if live is not None:
+    live.subscribe(figures.invalidate)
+
+
+def process_gauges():
+    """Figure cache and dataset gauges of this process, for /metrics."""
+    gauges = {
+        "hr_figure_cache_hits_total": figures.entries.hits,
+        "hr_figure_cache_misses_total": figures.entries.misses,
+        "hr_figure_cache_entries": len(figures.entries),
+    }
+    if live is not None:
+        gauges["hr_dataset_version"] = live.current.version
+        gauges["hr_dataset_rows"] = len(live.current.frame)
+    return gauges
+
+
+# Call counts and latencies per callback, served at /metrics. Workers started
+# by serve.py share HR_METRICS_DIR, so every scrape reports all of them.
+metrics = CallbackMetrics(
+    directory=os.getenv("HR_METRICS_DIR"),
+    gauges=process_gauges,
+    shared_gauges=("hr_dataset_version", "hr_dataset_rows"),
+)
+
+
+def queries():
+    """Object answering the callback aggregates: the current cube or the pushdown engine."""
+    return engine if live is None else live.current.cube
+
+
+def employee_points(department=None):
+    """Experience, rating and salary of the selected employees, for the density view.
+
+    Pushdown mode returns one row per distinct (experience, rating) pair with
+    its employee ``Count`` instead of one row per employee.
+    """
+    if live is None:
+        return engine.experience_performance_points(department)
+    return live.current.store.select(
+        ["Experience_Years", "Performance_Rating", "Salary_USD"], Department=department
+    )
+
+
+def dropdown_options():
+    """Return the (departments, work modes) offered in the dropdowns."""
+    if live is None:
+        return engine.options("Department"), engine.options("Work_Mode")
+    return live.current.departments, live.current.work_modes
+
+
+# --------------------------------------------------------------------------------- GLOBAL PLOTLY THEME
+
+px.defaults.template = "plotly_white"
+px.defaults.color_continuous_scale = "Viridis"
+px.defaults.color_discrete_sequence = ["#2E86C1", "#28B463", "#AF7AC5", "#F5B041", "#E74C3C"]
+
+pio.templates.default = "plotly_white"
+pio.templates["plotly_white"].layout.font.family = "Segoe UI"
+pio.templates["plotly_white"].layout.font.size = 13
+pio.templates["plotly_white"].layout.title.font.size = 20
+pio.templates["plotly_white"].layout.title.font.family = "Segoe UI"
+
+
+
+# --------------------------------------------------------------------------------- DASH APP LAYOUT
+
+app = Dash(
+    __name__,
+    meta_tags=[{"name": "viewport", "content": "width=device-width, initial-scale=1"}],
+)
+app.title = "HR Analytics Dashboard"
+
+# WSGI entry point for multi-worker servers (see serve.py)
+server = app.server
+
+
+@server.route("/metrics")
+def serve_metrics():
+    """Prometheus text metrics: callback latencies plus cache and dataset gauges."""
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+def serve_layout():
+    """Build the layout per page load so dropdowns follow dataset refreshes."""
+    departments, work_modes = dropdown_options()
+
+    return html.Div(
+        [
+            html.H2(
+                "HR Analytics Dashboard",
+                style={"textAlign": "center", "marginTop": "20px"},
+            ),
+
+            # KPI summary header
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.Div("👥", style={"fontSize": "28px"}),
+                            html.H4(
+                                "Total Employees",
+                                style={"color": "#666", "marginBottom": "0"},
+                            ),
+                            html.H3(id="kpi-total-employees", style={"color": "#2E86C1"}),
+                        ],
+                        style={"width": "30%", "textAlign": "center"},
+                    ),
+                    html.Div(
+                        [
+                            html.Div("💰", style={"fontSize": "28px"}),
+                            html.H4(
+                                "Average Salary ($)",
+                                style={"color": "#666", "marginBottom": "0"},
+                            ),
+                            html.H3(id="kpi-average-salary", style={"color": "#28B463"}),
+                        ],
+                        style={"width": "30%", "textAlign": "center"},
+                    ),
+                    html.Div(
+                        [
+                            html.Div("⏳", style={"fontSize": "28px"}),
+                            html.H4(
+                                "Average Experience (Years)",
+                                style={"color": "#666", "marginBottom": "0"},
+                            ),
+                            html.H3(
+                                id="kpi-average-experience", style={"color": "#AF7AC5"}
+                            ),
+                        ],
+                        style={"width": "30%", "textAlign": "center"},
+                    ),
+                ],
+                style={
+                    "display": "flex",
+                    "justifyContent": "space-around",
+                    "alignItems": "center",
+                    "margin": "20px auto",
+                    "backgroundColor": "#fdfdfd",
+                    "padding": "20px",
+                    "borderRadius": "12px",
+                    "boxShadow": "0 2px 8px rgba(0,0,0,0.1)",
+                    "width": "95%",
+                },
+            ),
+
+            # Dashboard tabs
+            dcc.Tabs(
+                [
+                    # Tab 1 — Turnover and retention
+                    dcc.Tab(
+                        label="Employee Turnover & Retention",
+                        children=[
+                            html.Div(
+                                [
+                                    html.Label(
+                                        "Select Department:",
+                                        style={"fontWeight": "bold"},
+                                    ),
+                                    dcc.Dropdown(
+                                        id="dept-dropdown",
+                                        options=[
+                                            {"label": dept, "value": dept}
+                                            for dept in departments
+                                        ],
+                                        placeholder="All Departments",
+                                        clearable=True,
+                                        style={"width": "50%", "marginBottom": "10px"},
+                                    ),
+                                    html.Div(
+                                        id="kpi-text",
+                                        style={
+                                            "textAlign": "center",
+                                            "fontSize": "18px",
+                                            "marginBottom": "20px",
+                                            "color": "#444",
+                                        },
+                                    ),
+                                    dcc.Graph(id="turnover-chart"),
+                                ],
+                                style={
+                                    "backgroundColor": "white",
+                                    "padding": "20px",
+                                    "margin": "20px",
+                                    "borderRadius": "10px",
+                                    "boxShadow": "0 2px 6px rgba(0,0,0,0.1)",
+                                },
+                            )
+                        ],
+                    ),
+
+                    # Tab 2 — Salary and compensation
+                    dcc.Tab(
+                        label="Salary and Compensation Trends",
+                        children=[
+                            html.Div(
+                                [
+                                    html.Label(
+                                        "Select Department:",
+                                        style={"fontWeight": "bold"},
+                                    ),
+                                    dcc.Dropdown(
+                                        id="salary-dept-dropdown",
+                                        options=[
+                                            {"label": dept, "value": dept}
+                                            for dept in departments
+                                        ],
+                                        placeholder="All Departments",
+                                        clearable=True,
+                                        style={"width": "50%", "marginBottom": "10px"},
+                                    ),
+                                    dcc.Graph(id="salary-chart"),
+                                ],
+                                style={
+                                    "backgroundColor": "white",
+                                    "padding": "20px",
+                                    "margin": "20px",
+                                    "borderRadius": "10px",
+                                    "boxShadow": "0 2px 6px rgba(0,0,0,0.1)",
+                                },
+                            )
+                        ],
+                    ),
+
+                    # Tab 3 — Performance vs experience
+                    dcc.Tab(
+                        label="Performance and Experience Relationship",
+                        children=[
+                            html.Div(
+                                [
+                                    html.Label(
+                                        "Select Department:",
+                                        style={"fontWeight": "bold"},
+                                    ),
+                                    dcc.Dropdown(
+                                        id="exp-perf-dropdown",
+                                        options=[
+                                            {"label": dept, "value": dept}
+                                            for dept in departments
+                                        ],
+                                        placeholder="All Departments",
+                                        clearable=True,
+                                        style={"width": "50%", "marginBottom": "10px"},
+                                    ),
+                                    dcc.RadioItems(
+                                        id="exp-perf-view",
+                                        options=[
+                                            {"label": "Job Title Averages", "value": "titles"},
+                                            {"label": "Employee Density", "value": "employees"},
+                                        ],
+                                        value="titles",
+                                        inline=True,
+                                        style={"fontSize": "14px", "marginBottom": "10px"},
+                                    ),
+                                    dcc.Checklist(
+                                        id="trendline-toggle",
+                                        options=[
+                                            {"label": "Show Trendline", "value": "show"}
+                                        ],
+                                        value=[],
+                                        inline=True,
+                                        style={
+                                            "fontSize": "14px",
+                                            "marginBottom": "15px",
+                                        },
+                                    ),
+                                    dcc.Checklist(
+                                        id="salary-weight-toggle",
+                                        options=[
+                                            {"label": "Weight Density by Salary", "value": "salary"}
+                                        ],
+                                        value=[],
+                                        inline=True,
+                                        # Shown with the density view only
+                                        style={
+                                            "fontSize": "14px",
+                                            "marginBottom": "15px",
+                                            "display": "none",
+                                        },
+                                    ),
+                                    dcc.Graph(id="exp-perf-chart"),
+                                ],
+                                style={
+                                    "backgroundColor": "white",
+                                    "padding": "20px",
+                                    "margin": "20px",
+                                    "borderRadius": "10px",
+                                    "boxShadow": "0 2px 6px rgba(0,0,0,0.1)",
+                                },
+                            )
+                        ],
+                    ),
+
+                    # Tab 4 — Workforce demographics
+                    dcc.Tab(
+                        label="Workforce Demographics and Headcount",
+                        children=[
+                            html.Div(
+                                [
+                                    html.Label(
+                                        "Select Work Mode:",
+                                        style={"fontWeight": "bold"},
+                                    ),
+                                    dcc.Dropdown(
+                                        id="workmode-dropdown",
+                                        options=[
+                                            {
+                                                "label": wm,
+                                                "value": wm,
+                                            }
+                                            for wm in work_modes
+                                        ],
+                                        placeholder="All Work Modes",
+                                        clearable=True,
+                                        style={"width": "50%", "marginBottom": "10px"},
+                                    ),
+                                    html.Div(
+                                        [
+                                            dcc.Graph(
+                                                id="headcount-chart",
+                                                style={
+                                                    "width": "60%",
+                                                    "display": "inline-block",
+                                                },
+                                            ),
+                                            dcc.Graph(
+                                                id="workmode-pie",
+                                                style={
+                                                    "width": "38%",
+                                                    "display": "inline-block",
+                                                    "float": "right",
+                                                },
+                                            ),
+                                        ]
+                                    ),
+                                ],
+                                style={
+                                    "backgroundColor": "white",
+                                    "padding": "20px",
+                                    "margin": "20px",
+                                    "borderRadius": "10px",
+                                    "boxShadow": "0 2px 6px rgba(0,0,0,0.1)",
+                                },
+                            )
+                        ],
+                    ),
+
+                    # Tab 5 — Promotion and career progression
+                    dcc.Tab(
+                        label="Promotion and Career Progression",
+                        children=[
+                            html.Div(
+                                [
+                                    html.Label(
+                                        "Select Department:",
+                                        style={"fontWeight": "bold"},
+                                    ),
+                                    dcc.Dropdown(
+                                        id="promotion-dept-dropdown",
+                                        options=[
+                                            {"label": dept, "value": dept}
+                                            for dept in departments
+                                        ],
+                                        placeholder="All Departments",
+                                        clearable=True,
+                                        style={"width": "50%", "marginBottom": "10px"},
+                                    ),
+                                    html.Div(
+                                        [
+                                            dcc.Graph(
+                                                id="promotion-chart",
+                                                style={
+                                                    "width": "55%",
+                                                    "display": "inline-block",
+                                                },
+                                            ),
+                                            dcc.Graph(
+                                                id="career-path-chart",
+                                                style={
+                                                    "width": "43%",
+                                                    "display": "inline-block",
+                                                    "float": "right",
+                                                },
+                                            ),
+                                        ]
+                                    ),
+                                ],
+                                style={
+                                    "backgroundColor": "white",
+                                    "padding": "20px",
+                                    "margin": "20px",
+                                    "borderRadius": "10px",
+                                    "boxShadow": "0 2px 6px rgba(0,0,0,0.1)",
+                                },
+                            )
+                        ],
+                    ),
+                ]
+            ),
+        ],
+        style={
+            "backgroundColor": "#f5f6fa",
+            "paddingBottom": "40px",
+            "fontFamily": "Segoe UI",
+        },
+    )
+
+
+app.layout = serve_layout
+
+
+# --------------------------------------------------------------------------------- DASH CALLBACKS
+
+# Summary KPI callback
+@app.callback(
+    [
+        Output("kpi-total-employees", "children"),
+        Output("kpi-average-salary", "children"),
+        Output("kpi-average-experience", "children"),
+    ],
+    Input("dept-dropdown", "value"),
+)
+@metrics.track("summary")
+@figures.memoize("summary")
+def update_summary_kpis(selected_dept):
+    total_employees, avg_salary, avg_experience = queries().summary(selected_dept)
+
+    return (
+        f"{total_employees:,}",
+        f"${avg_salary:,.0f}",
+        f"{avg_experience:.1f}",
+    )
+
+
+# Callback 1 — Turnover and Retention
+@app.callback(
+    [Output("turnover-chart", "figure"), Output("kpi-text", "children")],
+    Input("dept-dropdown", "value"),
+)
+@metrics.track("turnover")
+@figures.memoize("turnover")
+def update_turnover_chart(selected_dept):
+    if selected_dept:
+        group_field = "Job_Level"
+        title = f"Turnover Rate by Job Level – {selected_dept}"
+    else:
+        group_field = "Department"
+        title = "Turnover Rate by Department (Overall)"
+
+    turnover_data, total_turnover, total_employees = queries().turnover(
+        group_field, selected_dept
+    )
+    if total_employees == 0:
+        return px.bar(title=title), "No data available."
+
+    kpi_text = f"Overall Turnover Rate: {total_turnover:.1f}%"
+
+    fig = px.bar(
+        turnover_data,
+        x=group_field,
+        y="Turnover_Rate",
+        text=turnover_data["Turnover_Rate"].map("{:.1f}%".format),
+        color="Turnover_Rate",
+        title=title,
+    )
+    fig.update_layout(title_x=0.5, margin=dict(l=60, r=40, t=80, b=60))
+    return fig, kpi_text
+
+
+# Callback 2 — Salary and Compensation Trends
+@app.callback(
+    Output("salary-chart", "figure"),
+    Input("salary-dept-dropdown", "value"),
+)
+@metrics.track("salary")
+@figures.memoize("salary")
+def update_salary_chart(selected_dept):
+    if selected_dept:
+        df_salary = queries().salary_by_hire_year(selected_dept)
+
+        fig = px.line(
+            df_salary,
+            x="Hire_Date",
+            y="Salary_USD",
+            markers=True,
+            title=f"Average Salary Over Time – {selected_dept}",
+        )
+    else:
+        df_salary = queries().salary_by_department()
+        fig = px.bar(
+            df_salary,
+            x="Department",
+            y="Salary_USD",
+            text=df_salary["Salary_USD"].map("${:,.0f}".format),
+            color="Salary_USD",
+            title="Average Salary by Department",
+        )
+
+    fig.update_layout(title_x=0.5, margin=dict(l=60, r=40, t=80, b=60))
+    return fig
+
+
+# Callback 3 — Performance and Experience Relationship
+@app.callback(
+    Output("exp-perf-chart", "figure"),
+    [
+        Input("exp-perf-dropdown", "value"),
+        Input("trendline-toggle", "value"),
+        Input("exp-perf-view", "value"),
+        Input("salary-weight-toggle", "value"),
+    ],
+)
+@metrics.track("exp_perf")
+@figures.memoize("exp_perf")
+def update_exp_perf_chart(selected_dept, trendline_toggle, view="titles", salary_weight=None):
+    if selected_dept:
+        title = f"Experience vs Performance – {selected_dept}"
+    else:
+        title = "Experience vs Performance (All Departments)"
+
+    if view == "employees":
+        return employee_density_chart(
+            selected_dept,
+            title,
+            show_trendline="show" in (trendline_toggle or []),
+            weighted="salary" in (salary_weight or []),
+        )
+
+    grouped = queries().job_title_profile(selected_dept)
+
+    trendline_opt = "ols" if "show" in (trendline_toggle or []) else None
+
+    fig = px.scatter(
+        grouped,
+        x="Experience_Years",
+        y="Performance_Rating",
+        color="Job_Level" if selected_dept else "Department",
+        hover_name="Job_Title",
+        size="Salary_USD",
+        trendline=trendline_opt,
+        title=title,
+    )
+    fig.update_layout(
+        title_x=0.5,
+        margin=dict(l=60, r=40, t=80, b=60),
+        xaxis_title="Years of Experience",
+        yaxis_title="Performance Rating (1–5)",
+    )
+    return fig
+
+
+def employee_density_chart(selected_dept, title, show_trendline, weighted):
+    """Heatmap of employees binned on the server, with a closed-form OLS line."""
+    points = employee_points(selected_dept)
+    grid = density_grid(
+        points,
+        "Experience_Years",
+        "Performance_Rating",
+        weight="Salary_USD" if weighted else None,
+    )
+    z_title = "Total Salary ($)" if weighted else "Employees"
+
+    fig = go.Figure(
+        go.Heatmap(
+            x=grid.x,
+            y=grid.y,
+            # Empty bins are left blank rather than drawn as zero
+            z=np.where(grid.z > 0, grid.z, np.nan),
+            colorscale="Viridis",
+            colorbar=dict(title=z_title),
+            hovertemplate=(
+                "Experience: %{x:.1f}<br>Rating: %{y:.1f}<br>"
+                f"{z_title}: %{{z:,.0f}}<extra></extra>"
+            ),
+        )
+    )
+
+    line = fit_line(points, "Experience_Years", "Performance_Rating") if show_trendline else None
+    if line is not None:
+        x_range = np.array([grid.x.min(), grid.x.max()])
+        fig.add_trace(
+            go.Scatter(
+                x=x_range,
+                y=line.slope * x_range + line.intercept,
+                mode="lines",
+                line=dict(color="#E74C3C", width=3),
+                name=f"OLS trend (R² = {line.r_squared:.3f}, n = {line.n:,})",
+            )
+        )
+
+    fig.update_layout(
+        title=title,
+        title_x=0.5,
+        margin=dict(l=60, r=40, t=80, b=60),
+        xaxis_title="Years of Experience",
+        yaxis_title="Performance Rating (1–5)",
+        legend=dict(orientation="h", y=-0.2),
+    )
+    return fig
+
+
+@app.callback(
+    Output("salary-weight-toggle", "style"),
+    Input("exp-perf-view", "value"),
+)
+def toggle_salary_weight(view):
+    """Only the employee density view can be weighted by salary."""
+    style = {"fontSize": "14px", "marginBottom": "15px"}
+    if view != "employees":
+        style["display"] = "none"
+    return style
+
+
+# Callback 4 — Workforce Demographics and Headcount
+@app.callback(
+    [
+        Output("headcount-chart", "figure"),
+        Output("workmode-pie", "figure"),
+    ],
+    Input("workmode-dropdown", "value"),
+)
+@metrics.track("workforce")
+@figures.memoize("workforce")
+def update_workforce_charts(selected_workmode):
+    if selected_workmode:
+        title_suffix = f" – {selected_workmode}"
+    else:
+        title_suffix = ""
+
+    aggregates = queries()
+    dept_counts = aggregates.headcount("Department", selected_workmode, name="Headcount")
+    if dept_counts["Headcount"].sum() == 0:
+        return px.bar(title=f"Headcount by Department{title_suffix}"), px.pie(
+            title=f"Work Mode Distribution{title_suffix}"
+        )
+
+    workmode_counts = aggregates.headcount("Work_Mode", selected_workmode)
+
+    fig_bar = px.bar(
+        dept_counts,
+        x="Department",
+        y="Headcount",
+        text="Headcount",
+        color="Headcount",
+        title=f"Headcount by Department{title_suffix}",
+    )
+    fig_bar.update_layout(title_x=0.5, margin=dict(l=60, r=40, t=80, b=60))
+
+    fig_pie = px.pie(
+        workmode_counts,
+        names="Work_Mode",
+        values="Count",
+        hole=0.4,
+        title=f"Work Mode Distribution{title_suffix}",
+        color_discrete_sequence=px.colors.qualitative.Set2,
+    )
+    fig_pie.update_layout(title_x=0.5, margin=dict(l=20, r=20, t=80, b=60))
+
+    return fig_bar, fig_pie
+
+
+# Callback 5 — Promotion and Career Progression
+@app.callback(
+    [
+        Output("promotion-chart", "figure"),
+        Output("career-path-chart", "figure"),
+    ],
+    Input("promotion-dept-dropdown", "value"),
+)
+@metrics.track("promotion")
+@figures.memoize("promotion")
+def update_promotion_charts(selected_dept):
+    if selected_dept:
+        title_suffix = f" – {selected_dept}"
+    else:
+        title_suffix = ""
+
+    promotion_counts, career_path = queries().job_level_profile(selected_dept)
+    if promotion_counts["Employee_Count"].sum() == 0:
+        return px.bar(
+            title=f"Employee Distribution by Job Level{title_suffix}"
+        ), px.line(
+            title=f"Average Experience by Job Level{title_suffix}"
+        )
+
+    fig_bar = px.bar(
+        promotion_counts,
+        x="Job_Level",
+        y="Employee_Count",
+        text="Employee_Count",
+        color="Employee_Count",
+        title=f"Employee Distribution by Job Level{title_suffix}",
+    )
+    fig_bar.update_layout(title_x=0.5, margin=dict(l=60, r=40, t=80, b=60))
+
+    fig_line = px.line(
+        career_path,
+        x="Job_Level",
+        y="Experience_Years",
+        markers=True,
+        title=f"Average Experience by Job Level{title_suffix}",
+        color_discrete_sequence=["#2E86C1"],
+    )
+    fig_line.update_layout(title_x=0.5, margin=dict(l=60, r=40, t=80, b=60))
+
+    return fig_bar, fig_line
+
+
+# --------------------------------------------------------------------------------- FIGURE CACHE WARM-UP
+
+def warm_figure_cache(*_):
+    """Render every dropdown combination once so first clicks are cache hits."""
+    departments, work_modes = dropdown_options()
+    for dept in [None, *departments]:
+        update_summary_kpis(dept)
+        update_turnover_chart(dept)
+        update_salary_chart(dept)
+        update_promotion_charts(dept)
+        for trendline_toggle in ([], ["show"]):
+            update_exp_perf_chart(dept, trendline_toggle, "titles", [])
+            for salary_weight in ([], ["salary"]):
+                update_exp_perf_chart(dept, trendline_toggle, "employees", salary_weight)
+    for work_mode in [None, *work_modes]:
+        update_workforce_charts(work_mode)
+
+
+HR_FIGURE_WARMUP = os.getenv("HR_FIGURE_WARMUP", "0") == "1"
+
+if HR_FIGURE_WARMUP:
+    warm_figure_cache()
+    if live is not None:
+        # Listeners run on the refresher (or, in a worker, the file polling)
+        # thread, so re-rendering stays off requests
+        live.subscribe(warm_figure_cache)
+
+
+# --------------------------------------------------------------------------------- RUN SERVER
+
+if __name__ == "__main__":
+    app.run(debug=True)
\ No newline at end of file
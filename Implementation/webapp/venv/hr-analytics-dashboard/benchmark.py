@@ -0,0 +1,177 @@
+"""Startup, memory and callback latency benchmark at growing headcounts.
+
+Usage:
+    python benchmark.py --rows 5000 100000 1000000 --repeat 30 --out benchmark.csv
+
+For every row count a synthetic dataset (see synthetic_data.py) is written
+as an Arrow snapshot and the app is imported in a fresh process reading it,
+so each size reports its own startup time and peak RSS. Every callback is
+then called under every dropdown value, uncached (the function behind the
+figure cache) and cached, and the p50/p95/p99 wall times are reported.
+"""
+
+import argparse
+import inspect
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+APP_DIR = Path(__file__).resolve().parent
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _percentiles_ms(timings) -> dict:
+    p50, p95, p99 = np.percentile(np.array(timings) * 1000, [50, 95, 99])
+    return {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+
+
+def _time_calls(func, args, repeat: int) -> list:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+# --------------------------------------------------------------------------------- WORKER
+
+def run_worker(snapshot: Path, repeat: int) -> dict:
+    """Import the app on ``snapshot`` and time every callback and filter value."""
+    os.environ.update(
+        HR_QUERY_MODE="memory",
+        HR_DATA_SOURCE="cache",
+        HR_CACHE_PATH=str(snapshot),
+        HR_REFRESH_SECONDS="0",
+        HR_FIGURE_WARMUP="0",
+    )
+    sys.path.insert(0, str(APP_DIR))
+
+    start = time.perf_counter()
+    import app
+
+    startup_seconds = time.perf_counter() - start
+    startup_rss_mb = _peak_rss_mb()
+
+    departments, work_modes = app.dropdown_options()
+    cases = [
+        (name, func, value, args)
+        for name, func in [
+            ("summary", app.update_summary_kpis),
+            ("turnover", app.update_turnover_chart),
+            ("salary", app.update_salary_chart),
+            ("promotion", app.update_promotion_charts),
+        ]
+        for value, args in [("All", (None,))] + [(d, (d,)) for d in departments]
+    ]
+    cases += [
+        ("exp_perf", app.update_exp_perf_chart, f"{value} / {toggle}", (dept, toggles, "titles", []))
+        for value, dept in [("All", None)] + [(d, d) for d in departments]
+        for toggle, toggles in [("no trendline", []), ("trendline", ["show"])]
+    ]
+    cases += [
+        (
+            "exp_perf_density",
+            app.update_exp_perf_chart,
+            f"{value} / {toggle} / {weight}",
+            (dept, toggles, "employees", weights),
+        )
+        for value, dept in [("All", None)] + [(d, d) for d in departments]
+        for toggle, toggles in [("no trendline", []), ("trendline", ["show"])]
+        for weight, weights in [("count", []), ("salary", ["salary"])]
+    ]
+    cases += [
+        ("workforce", app.update_workforce_charts, value, (work_mode,))
+        for value, work_mode in [("All", None)] + [(w, w) for w in work_modes]
+    ]
+
+    results = []
+    for name, func, value, args in cases:
+        uncached = _time_calls(inspect.unwrap(func), args, repeat)
+        func(*args)
+        cached = _time_calls(func, args, repeat)
+        results.append(
+            {
+                "callback": name,
+                "filter": value,
+                **_percentiles_ms(uncached),
+                "cached_p50_ms": float(np.percentile(cached, 50)) * 1000,
+            }
+        )
+
+    return {
+        "rows": len(app.live.current.frame),
+        "startup_seconds": startup_seconds,
+        "startup_rss_mb": startup_rss_mb,
+        "peak_rss_mb": _peak_rss_mb(),
+        "callbacks": results,
+    }
+
+
+# --------------------------------------------------------------------------------- DRIVER
+
+def benchmark_size(rows: int, repeat: int, seed: int, workdir: Path) -> dict:
+    """Generate ``rows`` employees and benchmark them in a fresh process."""
+    from data_sources import SnapshotCache
+    from synthetic_data import generate_hr_data
+
+    snapshot = workdir / f"hr_data_{rows}.arrow"
+    SnapshotCache(snapshot).write(generate_hr_data(rows, seed=seed), source="synthetic")
+
+    command = [
+        sys.executable, str(Path(__file__).resolve()),
+        "--worker", str(snapshot), "--repeat", str(repeat),
+    ]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    snapshot.unlink()
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[5_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, help="CSV file for the per-callback results")
+    parser.add_argument("--worker", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.repeat)))
+        return
+
+    sys.path.insert(0, str(APP_DIR))
+    summaries, callbacks = [], []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.rows:
+            result = benchmark_size(rows, args.repeat, args.seed, Path(workdir))
+            summaries.append({k: v for k, v in result.items() if k != "callbacks"})
+            callbacks += [{"rows": result["rows"], **row} for row in result["callbacks"]]
+
+    per_callback = pd.DataFrame(callbacks)
+    print(pd.DataFrame(summaries).round(2).to_string(index=False))
+    print("\nSlowest filter value per callback:")
+    print(
+        per_callback.groupby(["rows", "callback"])[
+            ["p50_ms", "p95_ms", "p99_ms", "cached_p50_ms"]
+        ].max().round(3).to_string()
+    )
+    if args.out:
+        per_callback.to_csv(args.out, index=False)
+        print(f"\nPer-filter results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Per-callback call counts and latencies for the HR dashboard.
+
+``CallbackMetrics.track`` wraps a Dash callback and records how often it ran
+and how long it took, keeping the most recent durations for percentiles.
+``CallbackMetrics.render`` formats everything in the Prometheus text format;
+the app serves it at ``/metrics``.
+
+Under ``serve.py`` a scrape reaches one gunicorn worker at random, so every
+worker also writes its numbers to a JSON file in a shared directory
+(``HR_METRICS_DIR``) on a background thread, and ``render`` merges the files
+of all workers: counters are summed and percentiles are taken over the
+pooled latency windows.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class _CallbackStats:
+    def __init__(self, window: int):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.recent = deque(maxlen=window)
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class CallbackMetrics:
+    """Thread-safe call counters and latency windows, one per callback.
+
+    ``gauges`` returns this process's ``{name: value}`` gauges. With a
+    ``directory`` they are summed over the live workers, except the
+    ``shared_gauges``, which every worker reports alike and are shown once.
+    """
+
+    def __init__(self, window: int = 1024, directory=None, gauges=None,
+                 shared_gauges=(), flush_seconds: float = 1.0):
+        self.window = window
+        self.directory = None if directory is None else Path(directory)
+        self.flush_seconds = flush_seconds
+        self._gauges = gauges or dict
+        self._shared_gauges = set(shared_gauges)
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flusher_pid = None
+
+    def track(self, name: str):
+        """Decorator recording the call count and wall time of a callback."""
+        with self._lock:
+            stats = self._stats.setdefault(name, _CallbackStats(self.window))
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                self._start_flusher()
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                except Exception:
+                    with self._lock:
+                        stats.errors += 1
+                    raise
+                finally:
+                    elapsed = time.perf_counter() - start
+                    with self._lock:
+                        stats.count += 1
+                        stats.total_seconds += elapsed
+                        stats.recent.append(elapsed)
+
+            return wrapper
+
+        return decorator
+
+    # ----------------------------------------------------------------------------- WORKER FILES
+
+    def _local(self) -> dict:
+        """This process's callback stats and gauges, as written to its file."""
+        with self._lock:
+            callbacks = {
+                name: {
+                    "count": s.count,
+                    "errors": s.errors,
+                    "total_seconds": s.total_seconds,
+                    "recent": list(s.recent),
+                }
+                for name, s in self._stats.items()
+            }
+        return {"pid": os.getpid(), "callbacks": callbacks, "gauges": self._gauges()}
+
+    def flush(self):
+        """Atomically write this process's numbers to its file in ``directory``."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{os.getpid()}.json"
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with self._flush_lock:
+            tmp_path.write_text(json.dumps(self._local()))
+            os.replace(tmp_path, path)
+
+    def _start_flusher(self):
+        # Started lazily in the process serving requests: a thread started
+        # before a fork does not run in the children
+        if self.directory is None or self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+        threading.Thread(target=self._flush_loop, name="hr-metrics-flush", daemon=True).start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_seconds)
+            self.flush()
+
+    def _processes(self) -> list:
+        """Numbers of every process: this one live, the others from their files."""
+        if self.directory is None:
+            return [self._local()]
+        self.flush()
+        processes = []
+        for path in self.directory.glob("*.json"):
+            try:
+                processes.append(json.loads(path.read_text()))
+            except FileNotFoundError:
+                continue
+        return processes
+
+    # ----------------------------------------------------------------------------- SNAPSHOT
+
+    def snapshot(self) -> dict:
+        """Return ``{callback: {count, errors, total_seconds, p50, p95, p99}}``."""
+        return self._merge(self._processes())[0]
+
+    def _merge(self, processes: list):
+        """Merged callback rows and gauges of ``processes``."""
+        merged, gauges = {}, {}
+        for process in processes:
+            for name, stats in process["callbacks"].items():
+                row = merged.setdefault(
+                    name, {"count": 0, "errors": 0, "total_seconds": 0.0, "recent": []}
+                )
+                row["count"] += stats["count"]
+                row["errors"] += stats["errors"]
+                row["total_seconds"] += stats["total_seconds"]
+                row["recent"] += stats["recent"]
+            # A dead worker's calls still count, but its gauges are gone with it
+            if process["pid"] != os.getpid() and not _alive(process["pid"]):
+                continue
+            for gauge, value in process["gauges"].items():
+                if gauge in self._shared_gauges:
+                    gauges[gauge] = max(gauges.get(gauge, value), value)
+                else:
+                    gauges[gauge] = gauges.get(gauge, 0) + value
+
+        result = {}
+        for name, row in merged.items():
+            recent = np.array(row.pop("recent"))
+            for q in QUANTILES:
+                row[f"p{round(q * 100)}"] = float(np.quantile(recent, q)) if len(recent) else None
+            result[name] = row
+        return result, gauges
+
+    def render(self) -> str:
+        """Prometheus text exposition of the merged snapshot and gauges."""
+        snapshot, gauges = self._merge(self._processes())
+        lines = [
+            "# HELP hr_callback_seconds Dash callback wall time over the recent window.",
+            "# TYPE hr_callback_seconds summary",
+        ]
+        for name, row in snapshot.items():
+            labels = f'callback="{name}"'
+            for q in QUANTILES:
+                value = row[f"p{round(q * 100)}"]
+                if value is not None:
+                    lines.append(f'hr_callback_seconds{{{labels},quantile="{q}"}} {value:.6f}')
+            lines.append(f"hr_callback_seconds_sum{{{labels}}} {row['total_seconds']:.6f}")
+            lines.append(f"hr_callback_seconds_count{{{labels}}} {row['count']}")
+        lines += [
+            "# HELP hr_callback_errors_total Dash callbacks that raised.",
+            "# TYPE hr_callback_errors_total counter",
+        ]
+        for name, row in snapshot.items():
+            lines.append(f'hr_callback_errors_total{{callback="{name}"}} {row["errors"]}')
+        for gauge, value in gauges.items():
+            lines.append(f"# TYPE {gauge} gauge")
+            lines.append(f"{gauge} {value}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,242 @@
+"""Pluggable data sources for the HR dashboard.
+
+``load_hr_data`` returns the raw employee frame (in the layout of the
+warehouse query) by trying, in order:
+
+1. a fresh on-disk Arrow IPC snapshot, memory-mapped on read;
+2. the Databricks SQL warehouse, whose result refreshes the snapshot;
+3. the last snapshot even if it is stale, when the warehouse is unreachable;
+4. the bundled ``dataset/initial_dataset_sample.csv``.
+
+The behaviour is configured through environment variables:
+
+- ``HR_DATA_SOURCE``: ``auto`` (default), ``cache``, ``warehouse`` or ``csv``
+- ``HR_CACHE_PATH``: snapshot file (default ``.cache/hr_data.arrow``)
+- ``HR_CACHE_TTL_SECONDS``: snapshot freshness window (default 12 hours)
+- ``HR_SAMPLE_CSV``: CSV used by the offline fallback
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = Path(__file__).resolve().parent
+DEFAULT_CACHE_PATH = APP_DIR / ".cache" / "hr_data.arrow"
+DEFAULT_SAMPLE_CSV = APP_DIR.parents[1] / "dataset" / "initial_dataset_sample.csv"
+DEFAULT_CACHE_TTL_SECONDS = 12 * 60 * 60
+
+GOLD_SCHEMA = "workspace.applied_research_gold"
+
+_HR_QUERY_TEMPLATE = """
+    SELECT *
+    FROM (
+        SELECT
+            f.employee_id,
+            f.full_name,
+            d.name  AS Department,
+            j.name  AS Job_Title,
+            f.hire_date AS Hire_Date,
+            l.name  AS Location,
+            f.performance_rating AS Performance_Rating,
+            f.experience_years AS Experience_Years,
+            s.name  AS Status,
+            w.name  AS Work_Mode,
+            f.annual_salary AS Salary_INR,
+            jl.name AS Job_Level,
+            f.department_id AS Department_ID,
+            f.job_title_id  AS Job_Title_ID,
+            f.location_id   AS Location_ID,
+            f.status_id     AS Status_ID,
+            f.work_mode_id  AS Work_Mode_ID,
+            f.job_level_id  AS Job_Level_ID,
+            f.ingestion_timestamp AS Ingestion_Timestamp,
+            ROW_NUMBER() OVER (
+                PARTITION BY f.employee_id
+                ORDER BY f.hire_date DESC, f.ingestion_timestamp DESC
+            ) AS rn
+        FROM {GOLD_SCHEMA}.fact_table_gold_hr_data AS f
+            LEFT JOIN {GOLD_SCHEMA}.dim_department_gold AS d ON f.department_id = d.id
+            LEFT JOIN {GOLD_SCHEMA}.dim_job_title_gold  AS j ON f.job_title_id  = j.id
+            LEFT JOIN {GOLD_SCHEMA}.dim_location_gold   AS l ON f.location_id   = l.id
+            LEFT JOIN {GOLD_SCHEMA}.dim_status_gold     AS s ON f.status_id     = s.id
+            LEFT JOIN {GOLD_SCHEMA}.dim_work_mode_gold  AS w ON f.work_mode_id  = w.id
+            LEFT JOIN {GOLD_SCHEMA}.dim_job_level_gold  AS jl ON f.job_level_id = jl.id
+        {where}
+    ) t
+    WHERE rn = 1
+"""
+
+HR_QUERY = _HR_QUERY_TEMPLATE.format(GOLD_SCHEMA=GOLD_SCHEMA, where="")
+
+# Only the fact rows ingested since the watermark, reduced to the latest row
+# per employee with the same ROW_NUMBER rule as HR_QUERY. ingestion_timestamp
+# is a date in gold, so rows landed later on the watermark day need ``>=``.
+HR_DELTA_QUERY = _HR_QUERY_TEMPLATE.format(
+    GOLD_SCHEMA=GOLD_SCHEMA, where="WHERE f.ingestion_timestamp >= :watermark"
+)
+
+
+# --------------------------------------------------------------------------------- WAREHOUSE
+
+class WarehouseSource:
+    """Databricks SQL warehouse running the gold star-schema query."""
+
+    name = "warehouse"
+
+    def __init__(self, server_hostname=None, http_path=None, access_token=None):
+        self.server_hostname = server_hostname or os.getenv("DATABRICKS_SERVER_HOSTNAME")
+        self.http_path = http_path or os.getenv("DATABRICKS_HTTP_PATH")
+        self.access_token = access_token or os.getenv("DATABRICKS_TOKEN")
+
+    def connect(self):
+        """Open a connection, failing early when credentials are missing."""
+        required_vars = {
+            "DATABRICKS_SERVER_HOSTNAME": self.server_hostname,
+            "DATABRICKS_HTTP_PATH": self.http_path,
+            "DATABRICKS_TOKEN": self.access_token,
+        }
+        missing = [name for name, value in required_vars.items() if not value]
+        if missing:
+            raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
+
+        # Imported lazily so the cache and CSV sources work without the connector
+        from databricks import sql
+
+        return sql.connect(
+            server_hostname=self.server_hostname,
+            http_path=self.http_path,
+            access_token=self.access_token,
+        )
+
+    def load(self) -> pd.DataFrame:
+        """Run the HR query and return the raw result."""
+        with self.connect() as conn:
+            return pd.read_sql(HR_QUERY, conn)
+
+    def load_delta(self, watermark) -> pd.DataFrame:
+        """Return the latest row per employee ingested on or after ``watermark``."""
+        with self.connect() as conn:
+            return pd.read_sql(HR_DELTA_QUERY, conn, params={"watermark": watermark})
+
+
+# --------------------------------------------------------------------------------- SAMPLE CSV
+
+class CsvSource:
+    """Bundled sample CSV, renamed to the warehouse query layout."""
+
+    name = "csv"
+
+    def __init__(self, path=None):
+        self.path = Path(path or os.getenv("HR_SAMPLE_CSV") or DEFAULT_SAMPLE_CSV)
+
+    def load(self) -> pd.DataFrame:
+        """Read the CSV and align its columns with the warehouse query."""
+        return (
+            pd.read_csv(self.path)
+            .drop(columns=["Unnamed: 0"], errors="ignore")
+            .rename(columns={"Employee_ID": "employee_id", "Full_Name": "full_name"})
+        )
+
+
+# --------------------------------------------------------------------------------- SNAPSHOT CACHE
+
+class SnapshotCache:
+    """Arrow IPC snapshot of the raw query result, memory-mapped on read."""
+
+    name = "cache"
+    CREATED_AT_KEY = b"hr_snapshot_created_at"
+    SOURCE_KEY = b"hr_snapshot_source"
+
+    def __init__(self, path=None, ttl_seconds=None):
+        self.path = Path(path or os.getenv("HR_CACHE_PATH") or DEFAULT_CACHE_PATH)
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("HR_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS))
+        self.ttl_seconds = ttl_seconds
+
+    def _read_table(self):
+        """Memory-map the snapshot file; Arrow buffers point into the mapping."""
+        source = pa.memory_map(str(self.path), "r")
+        return pa.ipc.open_file(source).read_all()
+
+    def age(self):
+        """Seconds since the snapshot was written, or None if there is none."""
+        if not self.path.exists():
+            return None
+        source = pa.memory_map(str(self.path), "r")
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+        created_at = float(metadata.get(self.CREATED_AT_KEY, self.path.stat().st_mtime))
+        return time.time() - created_at
+
+    def is_fresh(self) -> bool:
+        """True when a snapshot exists and is younger than the TTL."""
+        age = self.age()
+        return age is not None and age <= self.ttl_seconds
+
+    def load(self) -> pd.DataFrame:
+        """Return the snapshot as a DataFrame."""
+        return self._read_table().to_pandas()
+
+    def write(self, df: pd.DataFrame, source: str = "warehouse"):
+        """Atomically replace the snapshot with ``df``."""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[self.CREATED_AT_KEY] = str(time.time()).encode()
+        metadata[self.SOURCE_KEY] = source.encode()
+        table = table.replace_schema_metadata(metadata)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        # Uncompressed so readers can memory-map the buffers directly
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, self.path)
+
+
+# --------------------------------------------------------------------------------- LOADER
+
+def load_hr_data(mode=None, cache=None, warehouse=None, csv=None) -> pd.DataFrame:
+    """Return the raw HR frame following the cache -> warehouse -> CSV order."""
+    mode = (mode or os.getenv("HR_DATA_SOURCE", "auto")).lower()
+    cache = cache or SnapshotCache()
+    warehouse = warehouse or WarehouseSource()
+    csv = csv or CsvSource()
+
+    if mode == "csv":
+        return csv.load()
+    if mode == "cache":
+        return cache.load()
+    if mode == "warehouse":
+        df = warehouse.load()
+        cache.write(df, source=warehouse.name)
+        return df
+    if mode != "auto":
+        raise ValueError(f"Unknown HR_DATA_SOURCE: {mode}")
+
+    if cache.is_fresh():
+        logger.info("Loading HR data from snapshot %s", cache.path)
+        return cache.load()
+
+    try:
+        df = warehouse.load()
+    except Exception as exc:
+        logger.warning("Warehouse unavailable (%s), falling back", exc)
+    else:
+        try:
+            cache.write(df, source=warehouse.name)
+        except OSError as exc:
+            logger.warning("Could not write snapshot %s (%s)", cache.path, exc)
+        return df
+
+    if cache.path.exists():
+        logger.info("Loading stale HR snapshot %s", cache.path)
+        return cache.load()
+
+    logger.info("Loading bundled sample %s", csv.path)
+    return csv.load()
@@ -0,0 +1,109 @@
+"""Server-side 2D binning and closed-form trendlines for employee-level charts.
+
+Plotting one marker per employee does not scale, so the employee-level view
+bins the points on the server and only sends the grid. ``density_grid`` bins
+with a single ``np.bincount`` over flattened bin numbers; ``fit_line`` solves
+ordinary least squares from the centred sums of squares and cross products
+instead of fitting a statsmodels model.
+
+Both accept either raw employee rows or pre-grouped points carrying a
+``Count`` column (one row per distinct (x, y) pair, as returned by the
+pushdown engine), which give identical results.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_BINS = 40
+
+
+@dataclass(frozen=True)
+class DensityGrid:
+    """Bin centres along each axis and the ``z[y, x]`` totals per bin."""
+
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+
+
+@dataclass(frozen=True)
+class LineFit:
+    """Least-squares line ``y = slope * x + intercept`` over ``n`` employees."""
+
+    slope: float
+    intercept: float
+    r_squared: float
+    n: int
+
+
+def _valid(points: pd.DataFrame, x: str, y: str):
+    """x and y arrays where both are known, their multiplicities and the mask.
+
+    Multiplicities are None for raw employee rows (each counts once).
+    """
+    xs = points[x].to_numpy(dtype="float64")
+    ys = points[y].to_numpy(dtype="float64")
+    counts = points["Count"].to_numpy(dtype="float64") if "Count" in points.columns else None
+    keep = ~np.isnan(xs + ys)
+    if keep.all():
+        return xs, ys, counts, slice(None)
+    return xs[keep], ys[keep], None if counts is None else counts[keep], keep
+
+
+def _edges(values: np.ndarray, max_bins: int) -> np.ndarray:
+    """Bin edges over ``values``; whole-number data gets one bin per value."""
+    lo, hi = float(values.min()), float(values.max())
+    if np.all(values == np.round(values)) and hi - lo + 1 <= max_bins:
+        return np.arange(lo - 0.5, hi + 1.5)
+    if lo == hi:
+        return np.array([lo - 0.5, hi + 0.5])
+    return np.linspace(lo, hi, max_bins + 1)
+
+
+def _bin_numbers(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    # Edges are evenly spaced, so the bin is an arithmetic division
+    width = edges[1] - edges[0]
+    return np.clip(((values - edges[0]) / width).astype(np.int64), 0, len(edges) - 2)
+
+
+def density_grid(points: pd.DataFrame, x: str, y: str, weight: str = None,
+                 max_bins: int = DEFAULT_MAX_BINS) -> DensityGrid:
+    """Employees (or the sum of ``weight``) per (x, y) bin, at most ``max_bins`` per axis."""
+    xs, ys, counts, keep = _valid(points, x, y)
+    if len(xs) == 0:
+        return DensityGrid(np.array([]), np.array([]), np.zeros((0, 0)))
+
+    totals = counts
+    if weight is not None:
+        # Grouped points already carry the weight summed over their employees
+        totals = np.nan_to_num(points[weight].to_numpy(dtype="float64")[keep])
+
+    x_edges, y_edges = _edges(xs, max_bins), _edges(ys, max_bins)
+    nx, ny = len(x_edges) - 1, len(y_edges) - 1
+    flat = _bin_numbers(ys, y_edges) * nx + _bin_numbers(xs, x_edges)
+    z = np.bincount(flat, weights=totals, minlength=nx * ny).reshape(ny, nx)
+    return DensityGrid(
+        (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2, z
+    )
+
+
+def fit_line(points: pd.DataFrame, x: str, y: str):
+    """Ordinary least squares of ``y`` on ``x``; None when it is undefined."""
+    xs, ys, counts, _ = _valid(points, x, y)
+    n = len(xs) if counts is None else counts.sum()
+    if n < 2:
+        return None
+    mean_x, mean_y = np.average(xs, weights=counts), np.average(ys, weights=counts)
+    # Sums of squares about the means, so large offsets do not cancel out
+    dx, dy = xs - mean_x, ys - mean_y
+    weighted_dx, weighted_dy = (dx, dy) if counts is None else (counts * dx, counts * dy)
+    sxx, syy, sxy = weighted_dx @ dx, weighted_dy @ dy, weighted_dx @ dy
+
+    if sxx <= 0:
+        return None
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+    r_squared = sxy * sxy / (sxx * syy) if syy > 0 else 1.0
+    return LineFit(float(slope), float(intercept), float(r_squared), int(n))
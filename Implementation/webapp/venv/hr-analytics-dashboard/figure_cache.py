@@ -0,0 +1,60 @@
+"""Memoized callback results for the HR dashboard.
+
+The dashboard inputs span a handful of departments, work modes and a
+trendline toggle, so almost every request repeats one already answered.
+``FigureCache.memoize`` wraps a Dash callback and keeps its return value
+(figures included) serialized to Plotly JSON, keyed by callback name and
+input values. A hit decodes that JSON instead of rebuilding the pandas
+aggregates, the Plotly Express figure and any statsmodels trendline.
+
+Entries belong to a cache generation; ``invalidate`` starts a new one when
+the dataset changes, so a result computed from the old data while the swap
+happens is never served afterwards.
+"""
+
+import functools
+import json
+import threading
+
+from plotly.io.json import to_json_plotly
+
+from ttl_cache import TTLCache
+
+
+def _freeze(value):
+    """Hashable form of a callback input (checklists arrive as lists)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class FigureCache:
+    """Bounded cache of serialized callback outputs."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = None):
+        self.entries = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def memoize(self, name: str):
+        """Decorator caching a callback's serialized result per input values."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args):
+                key = (self.generation, name, _freeze(args))
+                payload = self.entries.get(key)
+                if payload is None:
+                    payload = to_json_plotly(func(*args))
+                    self.entries.set(key, payload)
+                return json.loads(payload)
+
+            return wrapper
+
+        return decorator
+
+    def invalidate(self, *_):
+        """Forget every result; usable directly as a ``LiveDataset`` listener."""
+        with self._lock:
+            self.generation += 1
+            self.entries.clear()
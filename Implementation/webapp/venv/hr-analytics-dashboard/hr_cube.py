@@ -0,0 +1,252 @@
+"""Pre-aggregated HR cube used to serve the dashboard callbacks.
+
+The cube is built once from the cleaned employee frame and stores additive
+measures (counts, sums and non-null counts) for every combination of the
+dimensions below. Callbacks then filter and re-group the cube cells, so the
+cost of a dropdown change depends on the number of groups, not on the number
+of employee rows.
+"""
+
+import numpy as np
+import pandas as pd
+
+# --------------------------------------------------------------------------------- CUBE LAYOUT
+
+CUBE_DIMENSIONS = ["Department", "Job_Level", "Job_Title", "Work_Mode", "Hire_Year"]
+
+# Measure column in the employee frame -> (sum column, non-null count column)
+CUBE_MEASURES = {
+    "Salary_USD": ("Salary_Sum", "Salary_N"),
+    "Experience_Years": ("Experience_Sum", "Experience_N"),
+    "Performance_Rating": ("Rating_Sum", "Rating_N"),
+}
+
+
+def _mean(total: pd.Series, count: pd.Series) -> pd.Series:
+    """Divide a sum by its non-null count, returning NaN for empty groups."""
+    return total / count.where(count > 0)
+
+
+def _aggregate(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate employee rows into cube cells."""
+    work = pd.DataFrame(
+        {
+            "Department": df["Department"].array,
+            "Job_Level": df["Job_Level"].array,
+            "Job_Title": df["Job_Title"].array,
+            "Work_Mode": df["Work_Mode"].array,
+            "Hire_Year": df["Hire_Date"].dt.year.to_numpy(),
+            "Resigned": (df["Status"].str.lower() == "resigned").to_numpy(dtype="int64"),
+            "Employee": df["employee_id"].array,
+        }
+    )
+    for measure in CUBE_MEASURES:
+        work[measure] = df[measure].to_numpy(dtype="float64")
+
+    aggregations = {
+        "Count": ("Employee", "size"),
+        "Resigned": ("Resigned", "sum"),
+        # Lowest employee_id in the cell: the "first" Job_Level / Department
+        # per Job_Title are that employee's, as in the pushdown engine
+        "First_Employee": ("Employee", "min"),
+    }
+    for measure, (sum_col, count_col) in CUBE_MEASURES.items():
+        aggregations[sum_col] = (measure, "sum")
+        aggregations[count_col] = (measure, "count")
+
+    cells = (
+        work.groupby(CUBE_DIMENSIONS, dropna=False, sort=False, observed=True)
+        .agg(**aggregations)
+        .reset_index()
+    )
+    # Dictionary-encoded dimensions are decoded once here, at cube size,
+    # so the charts receive plain labels
+    for dim in CUBE_DIMENSIONS:
+        if isinstance(cells[dim].dtype, pd.CategoricalDtype):
+            cells[dim] = cells[dim].astype(object)
+    return cells
+
+
+def _cell_key(values) -> tuple:
+    """Hashable cell key with every missing value normalised to None."""
+    return tuple(None if pd.isna(value) else value for value in values)
+
+
+def _row_keys(df: pd.DataFrame):
+    """Cube cell key of every employee row in ``df``."""
+    columns = [df[dim].astype(object) for dim in CUBE_DIMENSIONS[:-1]]
+    return zip(*columns, df["Hire_Date"].dt.year)
+
+
+def _first_employee(cell: pd.Series, store) -> str:
+    """Scan the store rows of one Job_Title for the lowest employee_id of ``cell``."""
+    frame = store.frame
+    rows = store.index.positions("Job_Title", cell["Job_Title"])
+    match = np.ones(len(rows), dtype=bool)
+    for column in ("Department", "Job_Level", "Work_Mode"):
+        categories = frame[column].cat.categories
+        code = -1 if pd.isna(cell[column]) else categories.get_loc(cell[column])
+        match &= frame[column].cat.codes.to_numpy()[rows] == code
+    years = frame["Hire_Date"].take(rows).dt.year
+    if pd.isna(cell["Hire_Year"]):
+        match &= years.isna().to_numpy()
+    else:
+        match &= (years == cell["Hire_Year"]).to_numpy()
+    return frame["employee_id"].take(rows[match]).min()
+
+
+# --------------------------------------------------------------------------------- HR CUBE
+
+class HRCube:
+    """Additive aggregates over Department x Job_Level x Job_Title x Work_Mode x hire year."""
+
+    def __init__(self, cells: pd.DataFrame):
+        self.cells = cells
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "HRCube":
+        """Aggregate a cleaned employee frame into cube cells."""
+        return cls(_aggregate(df))
+
+    def apply_delta(self, removed, added, store) -> "HRCube":
+        """Return a new cube with ``removed`` rows subtracted and ``added`` rows added.
+
+        Additive measures are updated from the changed rows only. Cells whose
+        first employee was one of the replaced employees are re-scanned in
+        ``store`` through its row index, since a minimum cannot be subtracted.
+        """
+        plus = _aggregate(added)
+        minus = _aggregate(removed)
+        additive = [
+            col for col in plus.columns if col not in CUBE_DIMENSIONS + ["First_Employee"]
+        ]
+        minus[additive] = -minus[additive]
+
+        cells = (
+            pd.concat([self.cells, plus, minus[CUBE_DIMENSIONS + additive]], ignore_index=True)
+            .groupby(CUBE_DIMENSIONS, dropna=False, sort=False)
+            .agg(**{col: (col, "sum") for col in additive})
+        )
+        # Removed rows cannot lower a minimum, so they take no part in it
+        cells["First_Employee"] = (
+            pd.concat([self.cells, plus], ignore_index=True)
+            .groupby(CUBE_DIMENSIONS, dropna=False, sort=False)["First_Employee"]
+            .min()
+        )
+        cells = cells.reset_index()
+        cells = cells[cells["Count"] > 0].reset_index(drop=True)
+        cells = cells[self.cells.columns]
+
+        # A cell whose first employee was replaced is only stale if that
+        # employee now sits in another cell
+        landed = dict(zip(added["employee_id"], map(_cell_key, _row_keys(added))))
+        candidates = np.flatnonzero(
+            cells["First_Employee"].isin(removed["employee_id"]).to_numpy()
+        )
+        keys = zip(*(cells[dim].to_numpy()[candidates] for dim in CUBE_DIMENSIONS))
+        first_employees = cells["First_Employee"].to_numpy()[candidates]
+        for i, key, first_employee in zip(candidates, keys, first_employees):
+            if landed.get(first_employee) != _cell_key(key):
+                cells.loc[i, "First_Employee"] = _first_employee(cells.loc[i], store)
+        return HRCube(cells)
+
+    # ----------------------------------------------------------------------------- FILTERING
+
+    def filter(self, department=None, work_mode=None) -> pd.DataFrame:
+        """Return the cube cells matching the dropdown selections."""
+        cells = self.cells
+        if department:
+            cells = cells[cells["Department"] == department]
+        if work_mode:
+            cells = cells[cells["Work_Mode"] == work_mode]
+        return cells
+
+    # ----------------------------------------------------------------------------- CALLBACK QUERIES
+
+    def summary(self, department=None):
+        """Return (employee count, average salary, average experience)."""
+        cells = self.filter(department=department)
+        salary_n = cells["Salary_N"].sum()
+        experience_n = cells["Experience_N"].sum()
+        avg_salary = cells["Salary_Sum"].sum() / salary_n if salary_n else np.nan
+        avg_experience = (
+            cells["Experience_Sum"].sum() / experience_n if experience_n else np.nan
+        )
+        return int(cells["Count"].sum()), avg_salary, avg_experience
+
+    def turnover(self, group_field: str, department=None):
+        """Return (turnover rate per group, overall turnover rate, employee count)."""
+        cells = self.filter(department=department)
+        total = int(cells["Count"].sum())
+        if total == 0:
+            return pd.DataFrame(columns=[group_field, "Turnover_Rate"]), np.nan, 0
+
+        grouped = cells.groupby(group_field)[["Count", "Resigned"]].sum()
+        turnover_data = (
+            grouped.assign(Turnover_Rate=grouped["Resigned"] / grouped["Count"] * 100)
+            .reset_index()[[group_field, "Turnover_Rate"]]
+        )
+        overall = cells["Resigned"].sum() / total * 100
+        return turnover_data, overall, total
+
+    def salary_by_hire_year(self, department=None) -> pd.DataFrame:
+        """Average salary per hire year, with the year formatted as a string."""
+        cells = self.filter(department=department).dropna(subset=["Hire_Year"])
+        grouped = cells.groupby("Hire_Year")[["Salary_Sum", "Salary_N"]].sum()
+        return pd.DataFrame(
+            {
+                "Hire_Date": grouped.index.astype("int64").astype(str),
+                "Salary_USD": _mean(grouped["Salary_Sum"], grouped["Salary_N"]).to_numpy(),
+            }
+        )
+
+    def salary_by_department(self) -> pd.DataFrame:
+        """Average salary per department, highest first."""
+        grouped = self.cells.groupby("Department")[["Salary_Sum", "Salary_N"]].sum()
+        return (
+            _mean(grouped["Salary_Sum"], grouped["Salary_N"])
+            .rename("Salary_USD")
+            .reset_index()
+            .sort_values("Salary_USD", ascending=False)
+        )
+
+    def job_title_profile(self, department=None) -> pd.DataFrame:
+        """Per Job_Title means plus the Job_Level and Department of its first employee.
+
+        "First" is the lowest employee_id, whatever the row order of the frame.
+        """
+        cells = self.filter(department=department)
+        sums = cells.groupby("Job_Title")[
+            [col for pair in CUBE_MEASURES.values() for col in pair]
+        ].sum()
+        first = (
+            cells.sort_values("First_Employee")
+            .drop_duplicates("Job_Title")[["Job_Title", "Job_Level", "Department"]]
+            .set_index("Job_Title")
+        )
+
+        profile = pd.DataFrame(index=sums.index)
+        profile["Experience_Years"] = _mean(sums["Experience_Sum"], sums["Experience_N"])
+        profile["Performance_Rating"] = _mean(sums["Rating_Sum"], sums["Rating_N"])
+        profile["Salary_USD"] = _mean(sums["Salary_Sum"], sums["Salary_N"])
+        profile["Job_Level"] = first["Job_Level"]
+        profile["Department"] = first["Department"]
+        return profile.reset_index()
+
+    def headcount(self, group_field: str, work_mode=None, name: str = "Count") -> pd.DataFrame:
+        """Employee count per group for the selected work mode."""
+        cells = self.filter(work_mode=work_mode)
+        return cells.groupby(group_field)["Count"].sum().reset_index(name=name)
+
+    def job_level_profile(self, department=None):
+        """Return (employee count per Job_Level, average experience per Job_Level)."""
+        cells = self.filter(department=department)
+        grouped = cells.groupby("Job_Level")[["Count", "Experience_Sum", "Experience_N"]].sum()
+        counts = grouped["Count"].reset_index(name="Employee_Count")
+        career_path = (
+            _mean(grouped["Experience_Sum"], grouped["Experience_N"])
+            .rename("Experience_Years")
+            .reset_index()
+            .sort_values("Experience_Years")
+        )
+        return counts, career_path
@@ -0,0 +1,159 @@
+"""Versioned HR dataset with background incremental refresh.
+
+An ``HRDataset`` bundles everything the callbacks read: the compact store,
+the pre-aggregated cube, the dropdown options and the ingestion watermark.
+It is never mutated; a refresh builds a new one and ``LiveDataset`` swaps
+the reference in a single assignment, so a callback that grabbed
+``live.current`` keeps reading a consistent snapshot until it returns.
+"""
+
+import logging
+import threading
+
+import pandas as pd
+
+from hr_cube import HRCube
+from hr_store import HRStore
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_COLUMN = "Ingestion_Timestamp"
+
+
+def _max_watermark(df: pd.DataFrame, current=None):
+    """Latest ingestion timestamp in ``df`` combined with ``current``."""
+    if WATERMARK_COLUMN not in df.columns:
+        return current
+    latest = df[WATERMARK_COLUMN].max()
+    if pd.isna(latest):
+        return current
+    return latest if current is None else max(current, latest)
+
+
+def _carry_options(options: list, column: str, removed, added, cube: HRCube) -> list:
+    """Dropdown ``options`` after a delta, without rescanning the employee rows.
+
+    Values of the added rows join the list; a value only the removed rows held
+    leaves it once no cube cell counts it any more.
+    """
+    now = set(added[column].dropna())
+    gone = {
+        value for value in set(removed[column].dropna()) - now
+        if not (cube.cells[column] == value).any()
+    }
+    return sorted((set(options) | now) - gone)
+
+
+# --------------------------------------------------------------------------------- DATASET
+
+class HRDataset:
+    """Immutable bundle of store, cube and derived dropdown options."""
+
+    def __init__(
+        self, store: HRStore, cube: HRCube, watermark=None, version: int = 0,
+        departments: list = None, work_modes: list = None,
+    ):
+        self.store = store
+        self.cube = cube
+        # Latest ingestion timestamp loaded, or None when the source has none
+        self.watermark = watermark
+        self.version = version
+        # Carried from the previous version on a refresh
+        self.departments = store.options("Department") if departments is None else departments
+        self.work_modes = store.options("Work_Mode") if work_modes is None else work_modes
+
+    @classmethod
+    def build(cls, raw: pd.DataFrame) -> "HRDataset":
+        """Clean a raw query result and pre-aggregate it."""
+        store = HRStore.from_frame(raw)
+        return cls(store, HRCube.from_frame(store.frame), watermark=_max_watermark(raw))
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self.store.frame
+
+    def apply_delta(self, delta_raw: pd.DataFrame) -> "HRDataset":
+        """Return a new dataset with the changed employee rows merged in.
+
+        The dataset itself is returned when no row changes.
+        """
+        store, removed, _, added, added_rows = self.store.merge(delta_raw)
+        if not len(added_rows):
+            return self
+        cube = self.cube.apply_delta(removed, added, store)
+        return HRDataset(
+            store,
+            cube,
+            watermark=_max_watermark(delta_raw, self.watermark),
+            version=self.version + 1,
+            departments=_carry_options(self.departments, "Department", removed, added, cube),
+            work_modes=_carry_options(self.work_modes, "Work_Mode", removed, added, cube),
+        )
+
+
+# --------------------------------------------------------------------------------- LIVE HOLDER
+
+class LiveDataset:
+    """Holds the current HRDataset and notifies listeners when it is swapped."""
+
+    def __init__(self, dataset: HRDataset):
+        self.current = dataset
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener):
+        """Call ``listener(dataset)`` after every swap."""
+        self._listeners.append(listener)
+
+    def swap(self, dataset: HRDataset):
+        """Publish a new dataset; readers see either the old or the new one."""
+        with self._lock:
+            self.current = dataset
+        for listener in self._listeners:
+            listener(dataset)
+
+
+# --------------------------------------------------------------------------------- REFRESHER
+
+class DatasetRefresher(threading.Thread):
+    """Background thread pulling rows newer than the watermark into ``live``."""
+
+    def __init__(self, live: LiveDataset, source, interval_seconds: float):
+        super().__init__(name="hr-dataset-refresher", daemon=True)
+        self.live = live
+        self.source = source
+        self.interval_seconds = interval_seconds
+        self._stopped = threading.Event()
+
+    def refresh_once(self) -> bool:
+        """Fetch and merge one delta; return True when a new dataset was swapped in."""
+        current = self.live.current
+        watermark = current.watermark
+        if watermark is None:
+            logger.info("No ingestion watermark in the dataset, skipping refresh")
+            return False
+
+        delta = self.source.load_delta(watermark)
+        if delta.empty:
+            return False
+
+        # Rows of the watermark day come back every time and mostly change nothing
+        merged = current.apply_delta(delta)
+        if merged is current:
+            return False
+
+        self.live.swap(merged)
+        logger.info(
+            "Merged %d fetched employee rows (dataset version %d)", len(delta), merged.version
+        )
+        return True
+
+    def run(self):
+        while not self._stopped.wait(self.interval_seconds):
+            try:
+                self.refresh_once()
+            except Exception:
+                logger.exception("HR dataset refresh failed")
+
+    def stop(self):
+        self._stopped.set()
@@ -0,0 +1,453 @@
+"""Compact column store for the HR employee frame.
+
+Dimension columns are dictionary-encoded as pandas categoricals whose small
+integer codes index a per-dimension id/name table (the ``dim_*_gold`` tables
+when the gold ids are available). Measures are downcast to float32 where that
+is lossless, and a prebuilt row index maps every dimension value to its row
+positions so filters become a ``take`` instead of a string comparison.
+Columns no callback reads are not kept.
+"""
+
+import numpy as np
+import pandas as pd
+
+# --------------------------------------------------------------------------------- SCHEMA
+
+# Dimension column -> gold dimension table it is read from
+DIMENSION_TABLES = {
+    "Department": "dim_department_gold",
+    "Job_Title": "dim_job_title_gold",
+    "Job_Level": "dim_job_level_gold",
+    "Status": "dim_status_gold",
+    "Work_Mode": "dim_work_mode_gold",
+    "Location": "dim_location_gold",
+}
+
+MEASURE_COLUMNS = ["Performance_Rating", "Experience_Years", "Salary_USD"]
+
+# Dropped from the compact frame: no callback reads the names, and Salary_INR
+# is the same salary as Salary_USD before the INR_TO_USD conversion
+UNSERVED_COLUMNS = ["full_name", "Salary_INR"]
+
+# Dimensions with a prebuilt value -> row positions index
+INDEXED_DIMENSIONS = ["Department", "Job_Level", "Job_Title", "Status", "Work_Mode"]
+
+INR_TO_USD = 1
+
+
+# --------------------------------------------------------------------------------- CLEANING
+
+def clean_hr_data(df: pd.DataFrame, compact: bool = True) -> pd.DataFrame:
+    """Fill missing values, convert datatypes and add derived columns."""
+    df = df.copy()
+    df["Status"] = df["Status"].fillna("Active")
+    df["Department"] = df["Department"].fillna("Unknown")
+    df["Job_Level"] = df["Job_Level"].fillna("Unknown")
+    df["Job_Title"] = df["Job_Title"].fillna("Unknown")
+
+    df["Performance_Rating"] = pd.to_numeric(df["Performance_Rating"], errors="coerce")
+    df["Experience_Years"] = pd.to_numeric(df["Experience_Years"], errors="coerce")
+
+    df["Salary_INR"] = pd.to_numeric(df["Salary_INR"], errors="coerce")
+    df["Salary_USD"] = df["Salary_INR"] * INR_TO_USD
+
+    df["Hire_Date"] = _to_datetime(df["Hire_Date"])
+
+    if compact:
+        df, _ = compact_frame(df)
+    return df
+
+
+def _to_datetime(values: pd.Series) -> pd.Series:
+    """``pd.to_datetime`` that parses each distinct value only once."""
+    codes, uniques = pd.factorize(values)
+    parsed = pd.DatetimeIndex(pd.to_datetime(uniques, errors="coerce"))
+    return pd.Series(
+        parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=values.index
+    )
+
+
+def _downcast(values: pd.Series) -> pd.Series:
+    """Downcast a float64 measure to float32 when no value changes."""
+    as_float32 = values.astype("float32")
+    if np.array_equal(
+        as_float32.to_numpy(dtype="float64"), values.to_numpy(dtype="float64"), equal_nan=True
+    ):
+        return as_float32
+    return values
+
+
+def compact_frame(df: pd.DataFrame):
+    """Dictionary-encode dimensions, downcast measures and drop ``UNSERVED_COLUMNS``.
+
+    Returns the compact frame and a dict of dimension -> DataFrame(code, id, name).
+    When the frame carries the gold ``<Dimension>_ID`` columns they are used as
+    ids; otherwise ids are assigned in name order, like ``dim_create_update``.
+    """
+    df = df.drop(columns=UNSERVED_COLUMNS, errors="ignore")
+    dimensions = {}
+    for col in DIMENSION_TABLES:
+        if col not in df.columns:
+            continue
+        # Sorted names keep the category order identical to a groupby on strings
+        codes, names = pd.factorize(df[col], sort=True)
+        names = names.astype(object)
+        df[col] = pd.Categorical.from_codes(codes, categories=names)
+
+        id_col = f"{col}_ID"
+        if id_col in df.columns:
+            pairs = (
+                pd.DataFrame({"name": df[col].astype(object), "id": df[id_col]})
+                .dropna()
+                .drop_duplicates("name")
+                .set_index("name")["id"]
+            )
+            ids = pairs.reindex(names).astype("Int64").array
+            df = df.drop(columns=id_col)
+        else:
+            ids = np.arange(1, len(names) + 1)
+        dimensions[col] = pd.DataFrame(
+            {"code": np.arange(len(names), dtype="int32"), "id": ids, "name": names}
+        )
+
+    for col in MEASURE_COLUMNS:
+        if col in df.columns:
+            df[col] = _downcast(df[col])
+    return df, dimensions
+
+
+# --------------------------------------------------------------------------------- ROW INDEX
+
+class RowIndex:
+    """Map each dimension value to the sorted row positions that hold it.
+
+    Each column is indexed on first use, so swapping in a refreshed store does
+    not pay for indexes no callback has asked for yet, and a merge patches the
+    columns already indexed for the rows it touched.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns=INDEXED_DIMENSIONS, arrays=None):
+        self._df = df
+        self._columns = set(columns)
+        self._positions = {}
+        # Arrays built elsewhere, e.g. mapped from a published dataset
+        for column, (order, bounds) in (arrays or {}).items():
+            self._positions[column] = (df[column].cat.categories, order, bounds)
+
+    def _build(self, column: str):
+        codes = self._df[column].cat.codes.to_numpy()
+        categories = self._df[column].cat.categories
+        # Row positions fit in int32, half the size of argsort's result
+        order = np.argsort(codes, kind="stable").astype(np.int32)
+        order.flags.writeable = False
+        # Codes start at -1 for missing values; bounds[k] .. bounds[k + 1]
+        # delimits the rows holding category k inside ``order``.
+        bounds = np.searchsorted(codes[order], np.arange(len(categories) + 1))
+        self._positions[column] = (categories, order, bounds)
+        return self._positions[column]
+
+    def arrays(self) -> dict:
+        """``{column: (order, bounds)}`` for every indexed column, indexing the missing ones."""
+        return {
+            column: (self._positions.get(column) or self._build(column))[1:]
+            for column in sorted(self._columns)
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns indexed so far."""
+        return sum(order.nbytes + bounds.nbytes for _, order, bounds in self._positions.values())
+
+    def positions(self, column: str, value) -> np.ndarray:
+        """Row positions holding ``value`` (a read-only view, no copy)."""
+        if column not in self._columns:
+            raise KeyError(f"{column} is not an indexed dimension")
+        categories, order, bounds = self._positions.get(column) or self._build(column)
+        if value not in categories:
+            return order[:0]
+        code = categories.get_loc(value)
+        return order[bounds[code]:bounds[code + 1]]
+
+    def updated(self, df: pd.DataFrame, rows: np.ndarray) -> "RowIndex":
+        """Index of ``df``, a new version of the indexed frame where only ``rows`` changed.
+
+        ``rows`` holds replaced positions and positions appended at the end;
+        categories may only have been appended to. Columns already built are
+        patched by moving those rows between value groups instead of re-sorted.
+        """
+        index = RowIndex(df, self._columns)
+        replaced = rows[rows < len(self._df)]
+        appended = rows[rows >= len(self._df)]
+        for column, (_, order, bounds) in list(self._positions.items()):
+            codes = df[column].array.codes
+            categories = df[column].cat.categories
+            was = self._df[column].array.codes[replaced]
+            moved = was != codes[replaced]
+            out_rows, out_codes = replaced[moved], was[moved]
+            in_rows = np.concatenate([out_rows, appended])
+            in_codes = codes[in_rows]
+
+            # edges[code + 1] .. edges[code + 2] delimits a group, code -1 included
+            edges = np.concatenate(
+                [[0], bounds, np.full(len(categories) + 1 - len(bounds), bounds[-1])]
+            )
+            order = np.delete(order, _group_locations(order, edges, out_codes, out_rows))
+            edges = edges - _counts_before(out_codes, len(edges))
+
+            by_group = np.lexsort((in_rows, in_codes))
+            in_rows, in_codes = in_rows[by_group], in_codes[by_group]
+            order = np.insert(
+                order, _group_locations(order, edges, in_codes, in_rows), in_rows
+            )
+            edges = edges + _counts_before(in_codes, len(edges))
+
+            order.flags.writeable = False
+            index._positions[column] = (categories, order, edges[1:])
+        return index
+
+
+def _group_locations(order: np.ndarray, edges: np.ndarray, codes, rows) -> np.ndarray:
+    """Sorted location of each row inside the ``order`` group of its code."""
+    at = np.empty(len(rows), dtype=np.intp)
+    for code in np.unique(codes):
+        mine = codes == code
+        start, end = edges[code + 1], edges[code + 2]
+        at[mine] = start + np.searchsorted(order[start:end], rows[mine])
+    return at
+
+
+def _counts_before(codes, size: int) -> np.ndarray:
+    """How many of ``codes`` fall in the groups before each of the ``size`` edges."""
+    counts = np.bincount(np.asarray(codes, dtype=np.intp) + 1, minlength=size)
+    return np.concatenate([[0], np.cumsum(counts)[: size - 1]])
+
+
+def _encode_delta(delta: pd.DataFrame, frame: pd.DataFrame, dimensions: dict) -> pd.DataFrame:
+    """Encode ``delta`` in the dtypes of ``frame``, appending unseen names to the dimensions.
+
+    Unseen names extend the categories and a measure that no longer fits in
+    float32 becomes float64; ``frame`` itself is left untouched.
+    """
+    dtypes = frame.dtypes.to_dict()
+    for col, table in list(dimensions.items()):
+        categories = frame[col].cat.categories
+        names = delta[col].dropna().unique().astype(object)
+        unseen = names[categories.get_indexer(names) < 0]
+        if len(unseen):
+            dtypes[col] = pd.CategoricalDtype(categories.append(pd.Index(unseen, dtype=object)))
+            id_col = f"{col}_ID"
+            if id_col in delta.columns:
+                ids = (
+                    delta.drop_duplicates(col).set_index(col)[id_col]
+                    .reindex(unseen).astype("Int64").array
+                )
+            else:
+                start = int(table["id"].max()) if len(table) else 0
+                ids = np.arange(start + 1, start + 1 + len(unseen))
+            codes = np.arange(len(table), len(table) + len(unseen), dtype="int32")
+            dimensions[col] = pd.concat(
+                [table, pd.DataFrame({"code": codes, "id": ids, "name": unseen})],
+                ignore_index=True,
+            )
+
+    for col in MEASURE_COLUMNS:
+        if (
+            col in frame.columns
+            and frame[col].dtype == "float32"
+            and _downcast(delta[col]).dtype != "float32"
+        ):
+            # A new value is not exactly representable in float32
+            dtypes[col] = np.dtype("float64")
+    return delta.reindex(columns=frame.columns).astype(dtypes)
+
+
+def _changed(values: pd.Series, rows: np.ndarray, updates: pd.Series) -> np.ndarray:
+    """Mask of the ``updates`` that differ from ``values`` at ``rows``; missing equals missing."""
+    old, new = values.take(rows).astype(updates.dtype).array, updates.array
+    equal = pd.array(old == new, dtype="boolean").fillna(False).to_numpy(dtype=bool)
+    return ~(equal | (old.isna() & new.isna()))
+
+
+def _set_rows(values: pd.Series, rows: np.ndarray, updates: pd.Series) -> pd.Series:
+    """``values`` with ``rows`` set to ``updates``, copied only when something changes."""
+    changed = _changed(values, rows, updates)
+    if not changed.any():
+        return values
+    if values.dtype != updates.dtype:
+        values = values.astype(updates.dtype)
+    array = values.array.copy()
+    array[rows[changed]] = updates.array[changed]
+    return pd.Series(array, index=values.index, name=values.name, copy=False)
+
+
+# --------------------------------------------------------------------------------- EMPLOYEE INDEX
+
+class EmployeeIndex:
+    """Sorted 64-bit hashes of the employee ids with their row positions.
+
+    Lookups cost O(k log n) and appending employees is a sorted insert, so the
+    index is carried from one store version to the next instead of rebuilt.
+    """
+
+    def __init__(self, hashes: np.ndarray, rows: np.ndarray):
+        self.hashes = hashes
+        self.rows = rows
+
+    @staticmethod
+    def hash(employee_ids) -> np.ndarray:
+        return pd.util.hash_array(np.asarray(employee_ids, dtype=object))
+
+    @classmethod
+    def build(cls, employee_ids) -> "EmployeeIndex":
+        hashes = cls.hash(employee_ids)
+        order = np.argsort(hashes, kind="stable")
+        return cls(hashes[order], order)
+
+    def lookup(self, hashes: np.ndarray) -> np.ndarray:
+        """Row position stored for each hash, -1 when it is unknown."""
+        if len(self.hashes) == 0:
+            return np.full(len(hashes), -1)
+        at = np.minimum(np.searchsorted(self.hashes, hashes), len(self.hashes) - 1)
+        return np.where(self.hashes[at] == hashes, self.rows[at], -1)
+
+    def extend(self, hashes: np.ndarray, rows: np.ndarray) -> "EmployeeIndex":
+        """Return a new index with ``hashes`` stored at ``rows``."""
+        order = np.argsort(hashes, kind="stable")
+        at = np.searchsorted(self.hashes, hashes[order])
+        return EmployeeIndex(
+            np.insert(self.hashes, at, hashes[order]), np.insert(self.rows, at, rows[order])
+        )
+
+
+# --------------------------------------------------------------------------------- HR STORE
+
+class HRStore:
+    """Compact employee frame plus its dimension tables and row index."""
+
+    def __init__(self, frame: pd.DataFrame, dimensions: dict, employee_index=None, index=None):
+        self.frame = frame
+        self.dimensions = dimensions
+        # Carried from the previous version on a merge, patched for the changed rows
+        self.index = RowIndex(frame) if index is None else index
+        # Built on the first merge, off the startup path
+        self._employee_index = employee_index
+
+    @classmethod
+    def from_frame(cls, raw: pd.DataFrame) -> "HRStore":
+        """Clean a raw query result and build the compact store."""
+        frame, dimensions = compact_frame(clean_hr_data(raw, compact=False))
+        return cls(frame, dimensions)
+
+    def with_frame(self, frame: pd.DataFrame, index: RowIndex) -> "HRStore":
+        """This store over ``frame``, an equal copy of its frame held elsewhere (e.g. mapped)."""
+        return HRStore(frame, self.dimensions, self._employee_index, index)
+
+    def options(self, column: str) -> list:
+        """Sorted distinct values present in a dimension, for dropdowns."""
+        return sorted(self.frame[column].dropna().unique().astype(object))
+
+    def positions(self, **filters):
+        """Row positions matching every ``column=value`` filter, None when unfiltered."""
+        selected = None
+        for column, value in filters.items():
+            if not value:
+                continue
+            positions = self.index.positions(column, value)
+            selected = (
+                positions if selected is None else np.intersect1d(selected, positions)
+            )
+        return selected
+
+    def rows(self, **filters) -> pd.DataFrame:
+        """Return the employee rows matching every ``column=value`` filter."""
+        selected = self.positions(**filters)
+        if selected is None:
+            return self.frame
+        return self.frame.take(selected)
+
+    def select(self, columns, **filters) -> pd.DataFrame:
+        """Like ``rows`` but only gathers ``columns``."""
+        selected = self.positions(**filters)
+        if selected is None:
+            return self.frame[columns]
+        return self.frame[columns].take(selected)
+
+    def employee_positions(self, employee_ids) -> np.ndarray:
+        """Row position of each employee id, -1 when it is not in the store."""
+        if self._employee_index is None:
+            self._employee_index = EmployeeIndex.build(self.frame["employee_id"])
+        employee_ids = np.asarray(employee_ids, dtype=object)
+        positions = self._employee_index.lookup(EmployeeIndex.hash(employee_ids))
+
+        # Confirm hash hits against the stored ids; fall back on a collision
+        found = positions >= 0
+        stored = self.frame["employee_id"].take(positions[found]).to_numpy(dtype=object)
+        if (stored != employee_ids[found]).any():
+            return pd.Index(self.frame["employee_id"]).get_indexer(employee_ids)
+        return positions
+
+    # ----------------------------------------------------------------------------- INCREMENTAL MERGE
+
+    def merge(self, delta_raw: pd.DataFrame):
+        """Upsert changed employees, keeping the latest row per ``employee_id``.
+
+        ``delta_raw`` holds one row per changed employee, in the layout of the
+        warehouse query. A delta row replaces the stored one unless it has an
+        older ``Hire_Date`` (the ``ROW_NUMBER() ... ORDER BY hire_date DESC``
+        rule), and unknown employees are appended. Rows equal to the stored
+        ones are skipped, so a delta that changes nothing adds no rows.
+
+        Returns ``(store, removed, removed_rows, added, added_rows)`` where the
+        row frames and positions describe the change for incremental
+        aggregates. Replaced employees keep their row position.
+        """
+        delta = clean_hr_data(delta_raw, compact=False).drop_duplicates(
+            "employee_id", keep="first"
+        )
+        positions = self.employee_positions(delta["employee_id"])
+        existing = positions >= 0
+
+        old_dates = pd.Series(pd.NaT, index=delta.index, dtype=self.frame["Hire_Date"].dtype)
+        old_dates[existing] = self.frame["Hire_Date"].take(positions[existing]).array
+        new_dates = delta["Hire_Date"]
+        keep_old = (new_dates < old_dates) | (new_dates.isna() & old_dates.notna())
+        replace = existing & ~keep_old.to_numpy()
+        append = ~existing
+
+        dimensions = dict(self.dimensions)
+        delta = _encode_delta(delta, self.frame, dimensions)
+
+        # Rows equal to the stored ones (fetched again with their ingestion day) change nothing
+        candidates = np.flatnonzero(replace)
+        changed = np.zeros(len(candidates), dtype=bool)
+        for col in self.frame.columns:
+            changed |= _changed(self.frame[col], positions[candidates], delta[col].iloc[candidates])
+        replace[candidates[~changed]] = False
+
+        # Columns no replaced row changes are shared with this version, not copied
+        replaced_rows = positions[replace]
+        updates = delta[replace]
+        frame = pd.DataFrame(
+            {
+                col: _set_rows(self.frame[col], replaced_rows, updates[col])
+                for col in self.frame.columns
+            },
+            copy=False,
+        )
+
+        appended_rows = np.arange(len(frame), len(frame) + append.sum())
+        if len(appended_rows):
+            frame = pd.concat([frame, delta[append]], ignore_index=True)
+
+        added_rows = np.concatenate([replaced_rows, appended_rows])
+        employee_index = self._employee_index.extend(
+            EmployeeIndex.hash(delta.loc[append, "employee_id"]), appended_rows
+        )
+        store = HRStore(frame, dimensions, employee_index, self.index.updated(frame, added_rows))
+        return (
+            store,
+            self.frame.take(replaced_rows),
+            replaced_rows,
+            frame.take(added_rows),
+            added_rows,
+        )
@@ -0,0 +1,85 @@
+"""Compare the memory footprint of the plain and compact HR frames.
+
+Usage:
+    python memory_report.py --scale 200
+
+The sample CSV is repeated ``--scale`` times (with unique employee ids) and
+cleaned twice: once with the original object-string layout and once with the
+compact column store used by the dashboard. The "after" total includes the
+row index of every dimension the store filters on.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_sources import CsvSource
+from hr_store import HRStore, clean_hr_data
+
+
+def load_sample(path, scale: int) -> pd.DataFrame:
+    """Read the sample CSV in the warehouse query layout and repeat it ``scale`` times."""
+    df = pd.concat([CsvSource(path).load()] * scale, ignore_index=True)
+    df["employee_id"] = [f"EMP{i:010d}" for i in range(1, len(df) + 1)]
+    return df
+
+
+def frame_memory(df: pd.DataFrame) -> pd.Series:
+    """Deep memory usage per column, in MB."""
+    return df.memory_usage(deep=True, index=False) / 1e6
+
+
+def time_filter(func, repeat: int = 20) -> float:
+    """Median wall time of ``func`` in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", type=Path, help="defaults to the CsvSource sample")
+    parser.add_argument("--scale", type=int, default=200)
+    args = parser.parse_args()
+
+    raw = load_sample(args.csv, args.scale)
+    plain = clean_hr_data(raw, compact=False)
+    store = HRStore.from_frame(raw)
+
+    before = frame_memory(plain)
+    after = frame_memory(store.frame)
+    # Index every dimension, as the callbacks eventually do
+    store.index.arrays()
+    index_mb = store.index.nbytes / 1e6
+    after_total = after.sum() + index_mb
+    report = pd.DataFrame(
+        {
+            "before_dtype": plain.dtypes.astype(str),
+            "before_MB": before.round(2),
+            # Columns the compact store does not keep show as dropped
+            "after_dtype": store.frame.dtypes.astype(str).reindex(plain.columns, fill_value="dropped"),
+            "after_MB": after.round(2).reindex(plain.columns, fill_value=0.0),
+        }
+    )
+
+    print(f"Rows: {len(plain):,} (pandas {pd.__version__})")
+    print(report.to_string())
+    print(f"\nRow index:    {index_mb:,.1f} MB")
+    print(f"Total before: {before.sum():,.1f} MB")
+    print(f"Total after:  {after_total:,.1f} MB")
+    print(f"Reduction:    {before.sum() / after_total:.1f}x")
+
+    dept = store.options("Department")[0]
+    mask_ms = time_filter(lambda: plain[plain["Department"] == dept])
+    index_ms = time_filter(lambda: store.rows(Department=dept))
+    print(f"\nDepartment filter '{dept}': mask {mask_ms:.2f} ms, row index {index_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""Aggregate pushdown query mode for the HR dashboard.
+
+Instead of pulling every employee row into pandas, ``PushdownEngine`` turns
+each callback's filter and grouping into a parameterized ``GROUP BY`` over
+the gold star schema (``fact_table_gold_hr_data`` plus the ``dim_*_gold``
+tables). Queries run over a small connection pool and their results are kept
+in a bounded TTL/LRU cache keyed by SQL text and parameters.
+
+The engine exposes the same query methods as ``HRCube`` so the callbacks do
+not care which one serves them. ``PushdownEngine.for_sqlite`` loads a raw
+frame (e.g. the bundled sample CSV) into an in-memory SQLite star schema,
+which makes the pushdown path runnable and comparable offline.
+
+The app selects this mode with ``HR_QUERY_MODE=pushdown``. It is tuned with:
+
+- ``HR_PUSHDOWN_POOL_SIZE``: warehouse connections kept open (default 4)
+- ``HR_PUSHDOWN_CACHE_SIZE``: cached query results (default 512)
+- ``HR_PUSHDOWN_CACHE_TTL_SECONDS``: result freshness window (default 300)
+"""
+
+import itertools
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from data_sources import GOLD_SCHEMA
+from hr_store import DIMENSION_TABLES, INR_TO_USD
+from ttl_cache import TTLCache
+
+# Hire year expression per SQL dialect
+HIRE_YEAR_SQL = {
+    "databricks": "YEAR(f.hire_date)",
+    "sqlite": "CAST(strftime('%Y', f.hire_date) AS INTEGER)",
+}
+
+# Latest row per employee with the same cleaning rules as hr_store.clean_hr_data
+EMPLOYEES_CTE = """
+WITH employees AS (
+    SELECT *
+    FROM (
+        SELECT
+            f.employee_id,
+            COALESCE(d.name, 'Unknown')  AS Department,
+            COALESCE(jl.name, 'Unknown') AS Job_Level,
+            COALESCE(j.name, 'Unknown')  AS Job_Title,
+            COALESCE(s.name, 'Active')   AS Status,
+            w.name                       AS Work_Mode,
+            {hire_year}                  AS Hire_Year,
+            f.annual_salary * {inr_to_usd} AS Salary_USD,
+            f.experience_years           AS Experience_Years,
+            f.performance_rating         AS Performance_Rating,
+            ROW_NUMBER() OVER (
+                PARTITION BY f.employee_id
+                ORDER BY f.hire_date DESC, f.ingestion_timestamp DESC
+            ) AS rn
+        FROM {schema}.fact_table_gold_hr_data AS f
+            LEFT JOIN {schema}.dim_department_gold AS d ON f.department_id = d.id
+            LEFT JOIN {schema}.dim_job_title_gold  AS j ON f.job_title_id  = j.id
+            LEFT JOIN {schema}.dim_status_gold     AS s ON f.status_id     = s.id
+            LEFT JOIN {schema}.dim_work_mode_gold  AS w ON f.work_mode_id  = w.id
+            LEFT JOIN {schema}.dim_job_level_gold  AS jl ON f.job_level_id = jl.id
+    ) t
+    WHERE rn = 1
+)
+"""
+
+RESIGNED_SQL = "SUM(CASE WHEN LOWER(Status) = 'resigned' THEN 1 ELSE 0 END)"
+
+
+# --------------------------------------------------------------------------------- CONNECTION POOL
+
+class ConnectionPool:
+    """Reuse up to ``max_size`` connections instead of connecting per query."""
+
+    def __init__(self, connect, max_size: int = 4):
+        self._connect = connect
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; it is discarded if the block raises."""
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            except Exception:
+                conn.close()
+                raise
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# --------------------------------------------------------------------------------- LOCAL STAR SCHEMA
+
+def load_star_schema(raw: pd.DataFrame, conn):
+    """Write a raw HR frame into ``conn`` as the gold fact and dimension tables.
+
+    Dimension ids follow ``dim_create_update`` in the gold notebook: one id
+    per distinct name, assigned in name order starting at 1.
+    """
+    fact = pd.DataFrame(
+        {
+            "employee_id": raw["employee_id"],
+            "full_name": raw.get("full_name"),
+            "hire_date": pd.to_datetime(raw["Hire_Date"], errors="coerce").dt.strftime("%Y-%m-%d"),
+            "performance_rating": pd.to_numeric(raw["Performance_Rating"], errors="coerce"),
+            "experience_years": pd.to_numeric(raw["Experience_Years"], errors="coerce"),
+            "annual_salary": pd.to_numeric(raw["Salary_INR"], errors="coerce"),
+            "ingestion_timestamp": raw.get("Ingestion_Timestamp", "1970-01-01"),
+        }
+    )
+    for col, table in DIMENSION_TABLES.items():
+        codes, names = pd.factorize(raw[col], sort=True)
+        pd.DataFrame({"id": np.arange(1, len(names) + 1), "name": names.astype(object)}).to_sql(
+            table, conn, index=False, if_exists="replace"
+        )
+        fact[f"{table[len('dim_'):-len('_gold')]}_id"] = np.where(codes >= 0, codes + 1, None)
+    fact.to_sql("fact_table_gold_hr_data", conn, index=False, if_exists="replace")
+    conn.commit()
+
+
+# --------------------------------------------------------------------------------- PUSHDOWN ENGINE
+
+class PushdownEngine:
+    """Serve the dashboard aggregates with GROUP BY queries on the star schema."""
+
+    _sqlite_ids = itertools.count()
+
+    def __init__(self, pool: ConnectionPool, schema: str = GOLD_SCHEMA, dialect: str = "databricks",
+                 cache: TTLCache = None):
+        self.pool = pool
+        self.cache = cache if cache is not None else TTLCache(
+            max_entries=int(os.getenv("HR_PUSHDOWN_CACHE_SIZE", "512")),
+            ttl_seconds=float(os.getenv("HR_PUSHDOWN_CACHE_TTL_SECONDS", "300")),
+        )
+        self._cte = EMPLOYEES_CTE.format(
+            hire_year=HIRE_YEAR_SQL[dialect], inr_to_usd=INR_TO_USD, schema=schema
+        )
+        self._anchor = None
+
+    @classmethod
+    def for_warehouse(cls, warehouse, pool_size: int = None) -> "PushdownEngine":
+        """Engine over the Databricks gold schema, pooling ``warehouse.connect``."""
+        pool_size = pool_size or int(os.getenv("HR_PUSHDOWN_POOL_SIZE", "4"))
+        return cls(ConnectionPool(warehouse.connect, pool_size))
+
+    @classmethod
+    def for_sqlite(cls, raw: pd.DataFrame, pool_size: int = 4) -> "PushdownEngine":
+        """Engine over an in-memory SQLite copy of ``raw`` laid out as the gold schema."""
+        uri = f"file:hr_gold_{next(cls._sqlite_ids)}?mode=memory&cache=shared"
+
+        def connect():
+            return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+        # The shared in-memory database lives as long as one connection is open
+        anchor = connect()
+        load_star_schema(raw, anchor)
+        engine = cls(ConnectionPool(connect, pool_size), schema="main", dialect="sqlite")
+        engine._anchor = anchor
+        return engine
+
+    # ----------------------------------------------------------------------------- QUERY EXECUTION
+
+    def _query(self, select: str, department=None, work_mode=None, not_null=(),
+               group_by=None, order_by=None, source: str = "employees") -> pd.DataFrame:
+        """Run one aggregate query over ``source`` with the dashboard filters, cached."""
+        conditions, params = [], {}
+        if department:
+            conditions.append("Department = :department")
+            params["department"] = department
+        if work_mode:
+            conditions.append("Work_Mode = :work_mode")
+            params["work_mode"] = work_mode
+        conditions += [f"{column} IS NOT NULL" for column in not_null]
+
+        sql = f"{self._cte}SELECT {select}\nFROM {source}"
+        if conditions:
+            sql += f"\nWHERE {' AND '.join(conditions)}"
+        if group_by:
+            sql += f"\nGROUP BY {group_by}"
+        if order_by:
+            sql += f"\nORDER BY {order_by}"
+
+        key = (sql, tuple(sorted(params.items())))
+        return self.cache.get_or_compute(key, lambda: self._execute(sql, params))
+
+    def _execute(self, sql: str, params: dict) -> pd.DataFrame:
+        with self.pool.connection() as conn:
+            return pd.read_sql(sql, conn, params=params)
+
+    # ----------------------------------------------------------------------------- CALLBACK QUERIES
+
+    def options(self, column: str) -> list:
+        """Sorted distinct values of a dimension, for dropdowns."""
+        values = self._query(f"DISTINCT {column}", not_null=(column,), order_by=column)
+        return values[column].tolist()
+
+    def summary(self, department=None):
+        """Return (employee count, average salary, average experience)."""
+        row = self._query(
+            "COUNT(*) AS Count, AVG(Salary_USD) AS Salary_USD, "
+            "AVG(Experience_Years) AS Experience_Years",
+            department=department,
+        ).iloc[0]
+        # AVG over an empty selection is NULL, which read_sql returns as None
+        return (
+            int(row["Count"]),
+            float(row["Salary_USD"]) if pd.notna(row["Salary_USD"]) else np.nan,
+            float(row["Experience_Years"]) if pd.notna(row["Experience_Years"]) else np.nan,
+        )
+
+    def turnover(self, group_field: str, department=None):
+        """Return (turnover rate per group, overall turnover rate, employee count)."""
+        grouped = self._query(
+            f"{group_field}, COUNT(*) AS Count, {RESIGNED_SQL} AS Resigned",
+            department=department,
+            group_by=group_field,
+            order_by=group_field,
+        )
+        total = int(grouped["Count"].sum())
+        if total == 0:
+            return pd.DataFrame(columns=[group_field, "Turnover_Rate"]), np.nan, 0
+
+        turnover_data = grouped.assign(
+            Turnover_Rate=grouped["Resigned"] / grouped["Count"] * 100
+        )[[group_field, "Turnover_Rate"]]
+        overall = grouped["Resigned"].sum() / total * 100
+        return turnover_data, overall, total
+
+    def salary_by_hire_year(self, department=None) -> pd.DataFrame:
+        """Average salary per hire year, with the year formatted as a string."""
+        df_salary = self._query(
+            "Hire_Year, AVG(Salary_USD) AS Salary_USD",
+            department=department,
+            not_null=("Hire_Year",),
+            group_by="Hire_Year",
+            order_by="Hire_Year",
+        )
+        return pd.DataFrame(
+            {
+                "Hire_Date": df_salary["Hire_Year"].astype("int64").astype(str),
+                "Salary_USD": df_salary["Salary_USD"].astype("float64"),
+            }
+        )
+
+    def salary_by_department(self) -> pd.DataFrame:
+        """Average salary per department, highest first."""
+        return self._query(
+            "Department, AVG(Salary_USD) AS Salary_USD",
+            group_by="Department",
+            order_by="Salary_USD DESC",
+        )
+
+    def job_title_profile(self, department=None) -> pd.DataFrame:
+        """Per Job_Title means plus the Job_Level and Department of its first employee.
+
+        "First" is the lowest employee_id, as in ``HRCube.job_title_profile``.
+        """
+        return self._query(
+            "Job_Title, "
+            "AVG(Experience_Years) AS Experience_Years, "
+            "AVG(Performance_Rating) AS Performance_Rating, "
+            "AVG(Salary_USD) AS Salary_USD, "
+            "MAX(CASE WHEN title_rn = 1 THEN Job_Level END) AS Job_Level, "
+            "MAX(CASE WHEN title_rn = 1 THEN Department END) AS Department",
+            department=department,
+            group_by="Job_Title",
+            order_by="Job_Title",
+            source=(
+                "(SELECT *, ROW_NUMBER() OVER ("
+                + ("PARTITION BY Department, Job_Title" if department else "PARTITION BY Job_Title")
+                + " ORDER BY employee_id) AS title_rn FROM employees) e"
+            ),
+        )
+
+    def headcount(self, group_field: str, work_mode=None, name: str = "Count") -> pd.DataFrame:
+        """Employee count per group for the selected work mode."""
+        return self._query(
+            f"{group_field}, COUNT(*) AS {name}",
+            work_mode=work_mode,
+            not_null=(group_field,),
+            group_by=group_field,
+            order_by=group_field,
+        )
+
+    def job_level_profile(self, department=None):
+        """Return (employee count per Job_Level, average experience per Job_Level)."""
+        grouped = self._query(
+            "Job_Level, COUNT(*) AS Employee_Count, AVG(Experience_Years) AS Experience_Years",
+            department=department,
+            group_by="Job_Level",
+            order_by="Job_Level",
+        )
+        counts = grouped[["Job_Level", "Employee_Count"]]
+        career_path = grouped[["Job_Level", "Experience_Years"]].sort_values("Experience_Years")
+        return counts, career_path
+
+    def experience_performance_points(self, department=None) -> pd.DataFrame:
+        """Employee count and salary total per distinct (experience, rating) pair."""
+        return self._query(
+            "Experience_Years, Performance_Rating, COUNT(*) AS Count, SUM(Salary_USD) AS Salary_USD",
+            department=department,
+            not_null=("Experience_Years", "Performance_Rating"),
+            group_by="Experience_Years, Performance_Rating",
+        )
@@ -0,0 +1,83 @@
+"""Production entry point: one data loader, many gunicorn workers.
+
+Usage:
+    python serve.py --workers 4 --bind 0.0.0.0:8050
+
+This process loads the HR data once (snapshot cache, warehouse or CSV, see
+data_sources.py), publishes it to shared memory and keeps it refreshed. The
+gunicorn workers import ``app:server`` with ``HR_SHARED_DATASET`` pointing at
+the published file, so they map the same pages instead of each running the
+warehouse query and holding a private copy of the frame. They also share
+``HR_METRICS_DIR``, where each one leaves its callback metrics for ``/metrics``.
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from data_sources import WarehouseSource, load_hr_data
+from hr_dataset import DatasetRefresher, HRDataset
+from shared_dataset import PublishedDataset, SharedDatasetPublisher
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = Path(__file__).resolve().parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--bind", default=os.getenv("HR_BIND", "0.0.0.0:8050"))
+    parser.add_argument("--timeout", type=int, default=60)
+    args = parser.parse_args()
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+
+    # Every version is published, then only its mapped copy is kept here
+    publisher = SharedDatasetPublisher()
+    live = PublishedDataset(HRDataset.build(load_hr_data()), publisher)
+
+    refresh_seconds = float(os.getenv("HR_REFRESH_SECONDS", "900"))
+    if refresh_seconds > 0:
+        DatasetRefresher(live, WarehouseSource(), refresh_seconds).start()
+
+    metrics_dir = publisher.directory / "metrics"
+    env = dict(
+        os.environ,
+        HR_QUERY_MODE="memory",
+        HR_SHARED_DATASET=str(publisher.path),
+        HR_METRICS_DIR=str(metrics_dir),
+        # Refreshes run here; workers only follow the published file
+        HR_REFRESH_SECONDS="0",
+    )
+    command = [
+        sys.executable, "-m", "gunicorn",
+        "--workers", str(args.workers),
+        "--bind", args.bind,
+        "--timeout", str(args.timeout),
+        "app:server",
+    ]
+    logger.info("Starting %d workers on %s", args.workers, args.bind)
+    workers = subprocess.Popen(command, cwd=APP_DIR, env=env)
+    signal.signal(signal.SIGTERM, lambda *_: workers.terminate())
+    try:
+        returncode = workers.wait()
+    except KeyboardInterrupt:
+        workers.terminate()
+        returncode = workers.wait()
+    finally:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        publisher.close()
+    sys.exit(returncode)
+
+
+if __name__ == "__main__":
+    main()
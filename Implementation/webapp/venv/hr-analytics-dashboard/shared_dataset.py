@@ -0,0 +1,292 @@
+"""Share one copy of the HR dataset between server worker processes.
+
+The serving parent (``serve.py``) builds the dataset once and publishes it as
+an uncompressed Arrow IPC file, by default under ``/dev/shm``. Each column is
+written as a plain buffer without a validity bitmap (categoricals as their
+integer codes, missing measures as NaN, missing dates as NaT), so a worker
+that memory-maps the file gets pandas columns backed directly by the shared
+pages: no parsing, no copy, one physical copy of the data for all workers.
+
+The row index travels in the same file: the row order of each indexed
+dimension is one more int32 column, with its group bounds in the field
+metadata, so workers map it as well instead of sorting their own copy.
+
+The pre-aggregated cube is small and is published next to it; the dataset
+file names the cube file it belongs to, so replacing the dataset file with
+``os.replace`` switches both at once. Worker-side ``AttachedDataset`` polls
+the file on a background thread and swaps in a new version when the parent
+republishes.
+
+Employee ids and names are only needed to merge refreshes, which happen in
+the parent, so workers attach without them. The parent itself follows every
+publish with ``PublishedDataset``: it swaps in the dataset mapped from the
+file it just wrote, keeping only the ids and names as private columns.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from hr_cube import HRCube
+from hr_dataset import HRDataset, LiveDataset
+from hr_store import HRStore, RowIndex
+
+logger = logging.getLogger(__name__)
+
+DATASET_FILE = "hr_dataset.arrow"
+
+_CUBE_FILE_KEY = b"hr_cube_file"
+_VERSION_KEY = b"hr_dataset_version"
+_CATEGORIES_KEY = b"categories"
+_IDS_KEY = b"ids"
+_ROW_ORDER_KEY = b"row_order_of"
+_BOUNDS_KEY = b"bounds"
+
+
+def default_shared_dir() -> Path:
+    """``/dev/shm`` when the system has it, otherwise the temp directory."""
+    root = Path("/dev/shm") if Path("/dev/shm").is_dir() else Path(tempfile.gettempdir())
+    return root / f"hr-dashboard-{os.getpid()}"
+
+
+def _plain_array(values: np.ndarray, arrow_type) -> pa.Array:
+    """Arrow array over the raw values, without a validity bitmap."""
+    values = np.ascontiguousarray(values)
+    return pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(values)])
+
+
+def _write_ipc(table: pa.Table, path: Path):
+    """Atomically write ``table`` as a single-batch, uncompressed IPC file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table.combine_chunks())
+    os.replace(tmp_path, path)
+
+
+def _read_ipc(path: Path) -> pa.Table:
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+# --------------------------------------------------------------------------------- PUBLISH
+
+def _frame_table(frame: pd.DataFrame, dimensions: dict) -> pa.Table:
+    """Encode the compact frame columns as plain Arrow buffers."""
+    fields, arrays = [], []
+    for col in frame.columns:
+        values = frame[col]
+        metadata = None
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = values.cat.codes.to_numpy()
+            array = _plain_array(codes, pa.from_numpy_dtype(codes.dtype))
+            ids = dimensions[col]["id"] if col in dimensions else pd.Series(dtype="Int64")
+            metadata = {
+                _CATEGORIES_KEY: json.dumps(values.cat.categories.tolist()).encode(),
+                _IDS_KEY: json.dumps([None if pd.isna(i) else int(i) for i in ids]).encode(),
+            }
+        elif isinstance(values.dtype, pd.DatetimeTZDtype):
+            array = _plain_array(
+                values.array.asi8, pa.timestamp(values.dtype.unit, str(values.dtype.tz))
+            )
+        elif values.dtype.kind == "M":
+            array = _plain_array(
+                values.to_numpy().view("int64"), pa.from_numpy_dtype(values.dtype)
+            )
+        elif values.dtype.kind in "biuf":
+            array = _plain_array(values.to_numpy(), pa.from_numpy_dtype(values.dtype))
+        else:
+            # Strings (employee ids, names) stay in the parent
+            continue
+        fields.append(pa.field(col, array.type, metadata=metadata))
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _index_table(table: pa.Table, index: RowIndex) -> pa.Table:
+    """``table`` with the row order of every indexed dimension appended."""
+    for column, (order, bounds) in index.arrays().items():
+        metadata = {
+            _ROW_ORDER_KEY: column.encode(),
+            _BOUNDS_KEY: json.dumps(bounds.tolist()).encode(),
+        }
+        field = pa.field(f"{column}__row_order", pa.int32(), metadata=metadata)
+        table = table.append_column(field, _plain_array(order, pa.int32()))
+    return table
+
+
+class SharedDatasetPublisher:
+    """Write each dataset version to ``directory`` for worker processes."""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or os.getenv("HR_SHARED_DIR") or default_shared_dir())
+        self.path = self.directory / DATASET_FILE
+
+    def publish(self, dataset: HRDataset):
+        """Publish ``dataset``; usable directly as a ``LiveDataset`` listener."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        cube_file = f"hr_cube.{dataset.version}.arrow"
+        _write_ipc(
+            pa.Table.from_pandas(dataset.cube.cells, preserve_index=False),
+            self.directory / cube_file,
+        )
+
+        table = _frame_table(dataset.frame, dataset.store.dimensions)
+        table = _index_table(table, dataset.store.index)
+        table = table.replace_schema_metadata(
+            {_CUBE_FILE_KEY: cube_file.encode(), _VERSION_KEY: str(dataset.version).encode()}
+        )
+        _write_ipc(table, self.path)
+        self._remove_stale_cubes(keep=cube_file)
+        logger.info("Published HR dataset version %d to %s", dataset.version, self.path)
+
+    def _remove_stale_cubes(self, keep: str):
+        # Workers read the cube right after the dataset file, so only the
+        # previous version can still be in use
+        cubes = sorted(
+            self.directory.glob("hr_cube.*.arrow"), key=lambda p: p.stat().st_mtime
+        )
+        for stale in cubes[:-2]:
+            if stale.name != keep:
+                stale.unlink(missing_ok=True)
+
+    def close(self):
+        """Delete the published files."""
+        for path in self.directory.glob("*.arrow"):
+            path.unlink(missing_ok=True)
+        try:
+            self.directory.rmdir()
+        except OSError:
+            pass
+
+
+# --------------------------------------------------------------------------------- ATTACH
+
+def _frame_from_table(table: pa.Table):
+    """Compact frame, dimension tables and row index arrays, all views on ``table``."""
+    # Plain numeric and timestamp buffers convert without a copy
+    plain = table.to_pandas(split_blocks=True)
+    columns, dimensions, index_arrays = {}, {}, {}
+    for field in table.schema:
+        values = plain[field.name]
+        if field.metadata and _ROW_ORDER_KEY in field.metadata:
+            order = values.to_numpy()
+            order.flags.writeable = False
+            bounds = np.array(json.loads(field.metadata[_BOUNDS_KEY]), dtype=np.intp)
+            index_arrays[field.metadata[_ROW_ORDER_KEY].decode()] = (order, bounds)
+            continue
+        if field.metadata and _CATEGORIES_KEY in field.metadata:
+            categories = json.loads(field.metadata[_CATEGORIES_KEY])
+            # Object categories, as compact_frame builds them
+            values = pd.Categorical.from_codes(
+                values.to_numpy(), dtype=pd.CategoricalDtype(pd.Index(categories, dtype=object))
+            )
+            dimensions[field.name] = pd.DataFrame(
+                {
+                    "code": np.arange(len(categories), dtype="int32"),
+                    "id": pd.array(json.loads(field.metadata[_IDS_KEY]), dtype="Int64"),
+                    "name": pd.Series(categories, dtype=object),
+                }
+            )
+        columns[field.name] = values
+    # Built in one step: assigning the categoricals into ``plain`` copies their codes
+    frame = pd.DataFrame(columns, index=plain.index, copy=False)
+    return frame, dimensions, RowIndex(frame, arrays=index_arrays)
+
+
+def attach(path) -> HRDataset:
+    """Map a published dataset; its columns are views on the shared file."""
+    path = Path(path)
+    table = _read_ipc(path)
+    metadata = table.schema.metadata
+    frame, dimensions, index = _frame_from_table(table)
+    cube = HRCube(_read_ipc(path.with_name(metadata[_CUBE_FILE_KEY].decode())).to_pandas())
+    return HRDataset(
+        HRStore(frame, dimensions, index=index), cube, version=int(metadata[_VERSION_KEY])
+    )
+
+
+def _reattach(path, dataset: HRDataset) -> HRDataset:
+    """``dataset`` as published at ``path``: mapped columns plus its parent-only ones."""
+    mapped = attach(path)
+    columns = {
+        col: mapped.frame[col] if col in mapped.frame.columns else dataset.frame[col]
+        for col in dataset.frame.columns
+    }
+    frame = pd.DataFrame(columns, index=mapped.frame.index, copy=False)
+    index = RowIndex(frame, arrays=mapped.store.index.arrays())
+    return HRDataset(
+        dataset.store.with_frame(frame, index),
+        mapped.cube,
+        watermark=dataset.watermark,
+        version=dataset.version,
+        departments=dataset.departments,
+        work_modes=dataset.work_modes,
+    )
+
+
+class PublishedDataset(LiveDataset):
+    """Parent-side ``LiveDataset`` publishing every version through ``publisher``.
+
+    Each version is replaced by its re-attached copy before listeners see it,
+    so the parent keeps no private copy of the published columns.
+    """
+
+    def __init__(self, dataset: HRDataset, publisher: SharedDatasetPublisher):
+        self.publisher = publisher
+        super().__init__(self._publish(dataset))
+
+    def _publish(self, dataset: HRDataset) -> HRDataset:
+        self.publisher.publish(dataset)
+        return _reattach(self.publisher.path, dataset)
+
+    def swap(self, dataset: HRDataset):
+        super().swap(self._publish(dataset))
+
+
+class AttachedDataset(LiveDataset):
+    """Worker-side ``LiveDataset`` following the file published by the parent.
+
+    A daemon thread re-checks the file every ``poll_seconds`` and, when the
+    parent has replaced it, attaches the new version and swaps it in. Listeners
+    run on that thread, so requests only ever read ``current``.
+    """
+
+    def __init__(self, path, poll_seconds: float = 5):
+        self.path = Path(path)
+        self.poll_seconds = poll_seconds
+        self._stamp = self._file_stamp()
+        super().__init__(attach(self.path))
+        self._stopped = threading.Event()
+        threading.Thread(target=self._run, name="hr-dataset-attach", daemon=True).start()
+
+    def _file_stamp(self):
+        stat = os.stat(self.path)
+        return stat.st_ino, stat.st_mtime_ns
+
+    def poll_once(self) -> bool:
+        """Attach the published file if it was replaced; return True when it was swapped in."""
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return False
+        self.swap(attach(self.path))
+        # Only recorded once attached, so a failed attach is retried on the next poll
+        self._stamp = stamp
+        logger.info("Attached HR dataset version %d", self.current.version)
+        return True
+
+    def _run(self):
+        while not self._stopped.wait(self.poll_seconds):
+            try:
+                self.poll_once()
+            except Exception:
+                logger.exception("Could not attach the published HR dataset")
+
+    def stop(self):
+        self._stopped.set()
@@ -0,0 +1,118 @@
+"""Synthetic HR data following the bundled sample, from thousands to millions of rows.
+
+Usage:
+    python synthetic_data.py --rows 1000000 --out .cache/hr_data.arrow
+
+The generator learns the empirical distributions of
+``dataset/initial_dataset_sample.csv`` and draws new employees from them:
+
+- (Department, Job_Title) pairs, Status, Work_Mode, Performance_Rating and
+  Experience_Years with their sample frequencies;
+- hire years with their sample frequencies and a uniform day in the year;
+- salaries from the sample quantiles of the employee's Job_Level;
+- Job_Level from the snapshot notebook rules, with the pipeline's
+  ``job_level.assign_job_level`` so there is one copy of them.
+
+The result has the layout of the warehouse query, so ``HRDataset.build``
+accepts it unchanged. Text dimensions are returned as categoricals to keep
+10M-row frames in memory; ``--out`` writes an Arrow snapshot that
+``HR_DATA_SOURCE=cache`` with ``HR_CACHE_PATH`` loads.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_sources import CsvSource, SnapshotCache
+
+PIPELINE_DIR = Path(__file__).resolve().parents[3] / "databricks" / "pipeline"
+sys.path.append(str(PIPELINE_DIR))
+
+from job_level import assign_job_level  # noqa: E402
+
+
+def _draw(rng, counts: pd.Series, size: int) -> np.ndarray:
+    """Positions into ``counts.index`` drawn with the observed frequencies."""
+    return rng.choice(len(counts), size=size, p=(counts / counts.sum()).to_numpy())
+
+
+def _categorical(values, positions: np.ndarray) -> pd.Categorical:
+    """Categorical over ``values`` picked at ``positions`` (no per-row strings)."""
+    codes, uniques = pd.factorize(pd.Index(values).astype(object))
+    return pd.Categorical.from_codes(codes[positions], categories=uniques)
+
+
+def generate_hr_data(rows: int, seed: int = 0, sample: pd.DataFrame = None) -> pd.DataFrame:
+    """Return ``rows`` synthetic employees in the warehouse query layout."""
+    rng = np.random.default_rng(seed)
+    sample = CsvSource().load() if sample is None else sample
+
+    pairs = sample.groupby(["Department", "Job_Title"]).size()
+    pair_at = _draw(rng, pairs, rows)
+    departments = pairs.index.get_level_values("Department")
+    titles = pairs.index.get_level_values("Job_Title")
+
+    df = pd.DataFrame(
+        {
+            "employee_id": "EMP" + pd.Series(np.arange(1, rows + 1)).astype(str).str.zfill(7),
+            "full_name": _categorical(sample["full_name"], rng.integers(0, len(sample), rows)),
+            "Department": _categorical(departments, pair_at),
+            "Job_Title": _categorical(titles, pair_at),
+        }
+    )
+
+    hire_dates = pd.to_datetime(sample["Hire_Date"], utc=True)
+    years = hire_dates.dt.year.value_counts().sort_index()
+    year_at = _draw(rng, years, rows)
+    year_starts = pd.DatetimeIndex([pd.Timestamp(year, 1, 1, tz="UTC") for year in years.index])
+    last = hire_dates.max()
+    # The latest year only runs up to the last sampled hire date
+    days_in_year = np.where(years.index == last.year, last.dayofyear, 365)
+    df["Hire_Date"] = year_starts.take(year_at) + pd.to_timedelta(
+        rng.integers(0, days_in_year[year_at]), unit="D"
+    )
+
+    df["Location"] = _categorical(sample["Location"], rng.integers(0, len(sample), rows))
+    for col in ["Performance_Rating", "Experience_Years"]:
+        counts = sample[col].value_counts()
+        df[col] = counts.index.to_numpy(dtype="float64")[_draw(rng, counts, rows)]
+
+    for col in ["Status", "Work_Mode"]:
+        counts = sample[col].value_counts()
+        df[col] = _categorical(counts.index, _draw(rng, counts, rows))
+
+    df["Job_Level"] = pd.Categorical(assign_job_level(df["Job_Title"], df["Experience_Years"]))
+
+    # Inverse-CDF sampling of each Job_Level's salary distribution
+    salaries = sample.groupby("Job_Level")["Salary_INR"]
+    salary = np.full(rows, np.nan)
+    quantiles = np.linspace(0, 1, 101)
+    for level, positions in df.groupby("Job_Level", observed=True).indices.items():
+        curve = salaries.get_group(level).quantile(quantiles).to_numpy()
+        salary[positions] = np.round(np.interp(rng.random(len(positions)), quantiles, curve))
+    df["Salary_INR"] = salary
+
+    return df[list(sample.columns)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, required=True, help=".arrow snapshot or .csv file")
+    args = parser.parse_args()
+
+    df = generate_hr_data(args.rows, seed=args.seed)
+    if args.out.suffix == ".csv":
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(args.out, index=False)
+    else:
+        SnapshotCache(args.out).write(df, source="synthetic")
+    print(f"Wrote {len(df):,} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_sources import CsvSource  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def sample_raw() -> pd.DataFrame:
+    """The bundled sample in the warehouse layout, with missing values injected."""
+    raw = CsvSource().load()
+    rng = np.random.default_rng(0)
+    for col in [
+        "Department", "Job_Level", "Job_Title", "Status", "Work_Mode",
+        "Salary_INR", "Experience_Years", "Performance_Rating", "Hire_Date",
+    ]:
+        raw.loc[rng.choice(len(raw), 40, replace=False), col] = np.nan
+    raw.loc[rng.choice(len(raw), 5, replace=False), "Hire_Date"] = "not a date"
+    return raw
+
+
+def clean_like_original(raw: pd.DataFrame) -> pd.DataFrame:
+    """The cleaning block of the original app.py, applied to a copy of ``raw``."""
+    df = raw.copy()
+    df["Status"] = df["Status"].fillna("Active")
+    df["Department"] = df["Department"].fillna("Unknown")
+    df["Job_Level"] = df["Job_Level"].fillna("Unknown")
+    df["Job_Title"] = df["Job_Title"].fillna("Unknown")
+    df["Performance_Rating"] = pd.to_numeric(df["Performance_Rating"], errors="coerce")
+    df["Experience_Years"] = pd.to_numeric(df["Experience_Years"], errors="coerce")
+    df["Salary_INR"] = pd.to_numeric(df["Salary_INR"], errors="coerce")
+    df["Salary_USD"] = df["Salary_INR"] * 1
+    df["Hire_Date"] = pd.to_datetime(df["Hire_Date"], errors="coerce")
+    return df
+
+
+def assert_same(expected: pd.DataFrame, actual: pd.DataFrame):
+    """Same rows and values, ignoring dtypes and the index."""
+    pd.testing.assert_frame_equal(
+        expected.reset_index(drop=True).astype(object).infer_objects(),
+        actual.reset_index(drop=True).astype(object).infer_objects(),
+        check_dtype=False,
+        check_exact=False,
+        rtol=1e-9,
+    )
@@ -0,0 +1,47 @@
+"""Metrics rendered by any worker must cover the calls of every worker."""
+
+import multiprocessing
+
+from callback_metrics import CallbackMetrics
+
+
+def _worker(directory, calls, ready, done):
+    metrics = CallbackMetrics(directory=directory, gauges=lambda: {"hr_cache_entries": calls})
+    tracked = metrics.track("summary")(lambda: None)
+    for _ in range(calls):
+        tracked()
+    metrics.flush()
+    ready.set()
+    done.wait()
+
+
+def test_render_merges_worker_files(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    ready = [context.Event() for _ in range(2)]
+    done = context.Event()
+    workers = [
+        context.Process(target=_worker, args=(tmp_path, calls, event, done))
+        for calls, event in zip([3, 5], ready)
+    ]
+    for worker in workers:
+        worker.start()
+    for event in ready:
+        assert event.wait(30)
+
+    metrics = CallbackMetrics(
+        directory=tmp_path,
+        gauges=lambda: {"hr_cache_entries": 1, "hr_dataset_version": 7},
+        shared_gauges=("hr_dataset_version",),
+    )
+    metrics.track("summary")(lambda: None)()
+    assert metrics.snapshot()["summary"]["count"] == 9
+    assert "hr_cache_entries 9\n" in metrics.render()
+    assert "hr_dataset_version 7\n" in metrics.render()
+
+    # Calls of a worker that exited still count, its gauges do not
+    done.set()
+    for worker in workers:
+        worker.join()
+    rendered = metrics.render()
+    assert 'hr_callback_seconds_count{callback="summary"} 9\n' in rendered
+    assert "hr_cache_entries 1\n" in rendered
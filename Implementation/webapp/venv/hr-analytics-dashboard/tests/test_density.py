@@ -0,0 +1,81 @@
+"""Server-side binning and trendlines must match numpy and statsmodels on the same points."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+
+from density import _edges, density_grid, fit_line
+from hr_dataset import HRDataset
+from pushdown import PushdownEngine
+
+pytestmark = pytest.mark.filterwarnings("ignore:Converting to PeriodArray")
+
+KEYS = ["Experience_Years", "Performance_Rating"]
+
+
+def _random_points(offset: float = 0.0) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    x = rng.uniform(0, 30, 5000)
+    return pd.DataFrame(
+        {
+            "Experience_Years": x + offset,
+            "Performance_Rating": 0.05 * x + rng.normal(3, 0.8, len(x)),
+            "Salary_USD": rng.lognormal(11, 0.4, len(x)),
+        }
+    )
+
+
+@pytest.mark.parametrize("offset", [0.0, 1e6])
+def test_fit_line_matches_statsmodels(offset):
+    points = _random_points(offset)
+    points.loc[::50, "Performance_Rating"] = np.nan
+    known = points.dropna()
+    # The reference is fitted on the unshifted x, where it is well conditioned
+    design = sm.add_constant(known["Experience_Years"] - offset)
+    model = sm.OLS(known["Performance_Rating"], design).fit()
+    slope = model.params["Experience_Years"]
+
+    line = fit_line(points, *KEYS)
+    assert line.n == len(known)
+    np.testing.assert_allclose(line.slope, slope, rtol=1e-9)
+    np.testing.assert_allclose(line.intercept, model.params["const"] - slope * offset, rtol=1e-9)
+    np.testing.assert_allclose(line.r_squared, model.rsquared, rtol=1e-9)
+
+
+@pytest.mark.parametrize("weight", [None, "Salary_USD"])
+def test_density_grid_matches_histogram2d(weight):
+    points = _random_points()
+    grid = density_grid(points, *KEYS, weight=weight)
+
+    x, y = (points[key].to_numpy() for key in KEYS)
+    x_edges, y_edges = _edges(x, 40), _edges(y, 40)
+    weights = None if weight is None else points[weight].to_numpy()
+    expected, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges], weights=weights)
+
+    np.testing.assert_allclose(grid.z, expected.T, rtol=1e-9)
+    np.testing.assert_allclose(grid.x, (x_edges[:-1] + x_edges[1:]) / 2)
+    np.testing.assert_allclose(grid.y, (y_edges[:-1] + y_edges[1:]) / 2)
+
+
+def test_grouped_points_match_raw_rows(sample_raw):
+    dataset = HRDataset.build(sample_raw)
+    engine = PushdownEngine.for_sqlite(sample_raw)
+    for department in [None, *dataset.departments]:
+        raw = dataset.store.select([*KEYS, "Salary_USD"], Department=department)
+        grouped = engine.experience_performance_points(department)
+
+        for weight in [None, "Salary_USD"]:
+            expected = density_grid(raw, *KEYS, weight=weight)
+            actual = density_grid(grouped, *KEYS, weight=weight)
+            np.testing.assert_array_equal(actual.x, expected.x)
+            np.testing.assert_array_equal(actual.y, expected.y)
+            np.testing.assert_allclose(actual.z, expected.z, rtol=1e-9)
+
+        expected, actual = fit_line(raw, *KEYS), fit_line(grouped, *KEYS)
+        assert actual.n == expected.n
+        np.testing.assert_allclose(
+            [actual.slope, actual.intercept, actual.r_squared],
+            [expected.slope, expected.intercept, expected.r_squared],
+            rtol=1e-9,
+        )
@@ -0,0 +1,149 @@
+"""HRCube answers must match the original per-callback pandas groupbys."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import assert_same, clean_like_original
+from hr_dataset import HRDataset
+
+pytestmark = pytest.mark.filterwarnings("ignore:Converting to PeriodArray")
+
+
+# --------------------------------------------------------------------------------- ORIGINAL CALLBACK LOGIC
+
+def _by_department(df, department):
+    return df[df["Department"] == department] if department else df
+
+
+def original_summary(df, department):
+    df = _by_department(df, department)
+    return len(df), df["Salary_USD"].mean(), df["Experience_Years"].mean()
+
+
+def original_turnover(df, group_field, department):
+    df = _by_department(df, department)
+    # The original summed a per-group lambda; pandas 3 casts that result back to
+    # the str dtype of Status, so the same flag is computed before grouping
+    turnover = (
+        df.assign(Resigned=df["Status"].str.lower() == "resigned")
+        .groupby(group_field)
+        .agg(Total=("Status", "size"), Resigned=("Resigned", "sum"))
+        .assign(Turnover_Rate=lambda x: x["Resigned"] / x["Total"] * 100)
+        .reset_index()[[group_field, "Turnover_Rate"]]
+    )
+    overall = (df["Status"].str.lower() == "resigned").sum() / len(df) * 100 if len(df) else np.nan
+    return turnover, overall, len(df)
+
+
+def original_salary_by_hire_year(df, department):
+    df = _by_department(df, department)
+    salary = df.groupby(df["Hire_Date"].dt.to_period("Y"))["Salary_USD"].mean().reset_index()
+    salary["Hire_Date"] = salary["Hire_Date"].astype(str)
+    return salary
+
+
+def original_salary_by_department(df):
+    return (
+        df.groupby("Department")["Salary_USD"].mean().reset_index()
+        .sort_values("Salary_USD", ascending=False)
+    )
+
+
+def original_job_title_profile(df, department):
+    df = _by_department(df, department)
+    return (
+        df.groupby("Job_Title")
+        .agg(
+            Experience_Years=("Experience_Years", "mean"),
+            Performance_Rating=("Performance_Rating", "mean"),
+            Salary_USD=("Salary_USD", "mean"),
+            Job_Level=("Job_Level", "first"),
+            Department=("Department", "first"),
+        )
+        .reset_index()
+    )
+
+
+def original_headcount(df, group_field, work_mode, name):
+    if work_mode:
+        df = df[df["Work_Mode"] == work_mode]
+    return df.groupby(group_field).size().reset_index(name=name)
+
+
+def original_job_level_profile(df, department):
+    df = _by_department(df, department)
+    counts = df.groupby("Job_Level").size().reset_index(name="Employee_Count")
+    career_path = (
+        df.groupby("Job_Level")["Experience_Years"].mean().reset_index()
+        .sort_values("Experience_Years")
+    )
+    return counts, career_path
+
+
+# --------------------------------------------------------------------------------- HELPERS
+
+def assert_cube_matches(cube, df):
+    departments = sorted(df["Department"].dropna().unique()) + [None, "Nope"]
+    work_modes = sorted(df["Work_Mode"].dropna().unique()) + [None, "Nope"]
+
+    for department in departments:
+        np.testing.assert_allclose(
+            cube.summary(department), original_summary(df, department), rtol=1e-9
+        )
+
+        group_field = "Job_Level" if department else "Department"
+        expected, expected_overall, expected_total = original_turnover(df, group_field, department)
+        turnover, overall, total = cube.turnover(group_field, department)
+        assert total == expected_total
+        np.testing.assert_allclose(overall, expected_overall, rtol=1e-9)
+        if expected_total:
+            assert_same(expected, turnover)
+
+        assert_same(original_salary_by_hire_year(df, department), cube.salary_by_hire_year(department))
+        assert_same(original_job_title_profile(df, department), cube.job_title_profile(department))
+
+        expected_counts, expected_path = original_job_level_profile(df, department)
+        counts, career_path = cube.job_level_profile(department)
+        assert_same(expected_counts, counts)
+        assert_same(expected_path, career_path)
+
+    assert_same(original_salary_by_department(df), cube.salary_by_department())
+
+    for work_mode in work_modes:
+        assert_same(
+            original_headcount(df, "Department", work_mode, "Headcount"),
+            cube.headcount("Department", work_mode, name="Headcount"),
+        )
+        assert_same(
+            original_headcount(df, "Work_Mode", work_mode, "Count"),
+            cube.headcount("Work_Mode", work_mode),
+        )
+
+
+# --------------------------------------------------------------------------------- TESTS
+
+def test_cube_matches_original_callbacks(sample_raw):
+    dataset = HRDataset.build(sample_raw)
+    assert_cube_matches(dataset.cube, clean_like_original(sample_raw))
+
+
+@pytest.mark.parametrize("replaced, appended", [(300, 100), (1, 0), (0, 25)])
+def test_cube_after_delta_matches_original_callbacks(sample_raw, replaced, appended):
+    base = sample_raw.iloc[:-appended or None].reset_index(drop=True)
+    rng = np.random.default_rng(replaced)
+
+    changed = base.sample(replaced, random_state=1).copy()
+    changed["Department"] = rng.choice(["IT", "HR", "Legal", None], replaced)
+    changed["Status"] = rng.choice(["Active", "Resigned", None], replaced)
+    changed["Salary_INR"] = changed["Salary_INR"] * 1.5
+    new = sample_raw.iloc[len(base):]
+    delta = pd.concat([changed, new], ignore_index=True)
+
+    # Replaced employees keep their row position, new ones are appended
+    expected = base.copy()
+    expected.loc[changed.index] = changed
+    expected = pd.concat([expected, new], ignore_index=True)
+
+    dataset = HRDataset.build(base).apply_delta(delta)
+    assert_cube_matches(dataset.cube, clean_like_original(expected))
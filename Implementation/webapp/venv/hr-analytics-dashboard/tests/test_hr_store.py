@@ -0,0 +1,88 @@
+"""A merged store must equal one rebuilt from scratch, while sharing what did not change."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_dataset import DatasetRefresher, HRDataset, LiveDataset
+from hr_store import INDEXED_DIMENSIONS, RowIndex
+
+pytestmark = pytest.mark.filterwarnings("ignore:Converting to PeriodArray")
+
+
+def _delta(base: pd.DataFrame, new: pd.DataFrame, replaced: int) -> pd.DataFrame:
+    rng = np.random.default_rng(replaced)
+    changed = base.sample(replaced, random_state=2).copy()
+    changed["Department"] = rng.choice(["IT", "Legal", None], replaced)
+    changed["Work_Mode"] = rng.choice(["Remote", "Hybrid", "Moon", None], replaced)
+    changed["Job_Title"] = rng.choice(base["Job_Title"].dropna().unique(), replaced)
+    return pd.concat([changed, new], ignore_index=True)
+
+
+@pytest.mark.parametrize("replaced, appended", [(300, 100), (1, 0), (0, 25)])
+def test_merge_patches_index_and_options(sample_raw, replaced, appended):
+    base = sample_raw.iloc[:-appended or None].reset_index(drop=True)
+    dataset = HRDataset.build(base)
+    for column in INDEXED_DIMENSIONS:
+        dataset.store.index.positions(column, "Unknown")
+
+    merged = dataset.apply_delta(_delta(base, sample_raw.iloc[len(base):], replaced))
+    store = merged.store
+
+    rebuilt = RowIndex(store.frame)
+    for column in INDEXED_DIMENSIONS:
+        for value in store.frame[column].cat.categories:
+            patched = store.index.positions(column, value)
+            np.testing.assert_array_equal(patched, rebuilt.positions(column, value))
+            assert patched.dtype == np.int32
+        # Missing values stay out of every group
+        categories = store.frame[column].cat.categories
+        grouped = sum(len(store.index.positions(column, value)) for value in categories)
+        assert grouped == store.frame[column].notna().sum()
+
+    assert merged.departments == store.options("Department")
+    assert merged.work_modes == store.options("Work_Mode")
+
+
+def test_merge_shares_unchanged_columns(sample_raw):
+    dataset = HRDataset.build(sample_raw)
+    delta = sample_raw.iloc[[3, 7]].copy()
+    delta["Salary_INR"] = delta["Salary_INR"].fillna(0) + 1
+
+    before = dataset.store.frame
+    after = dataset.apply_delta(delta).store.frame
+    assert not np.shares_memory(after["Salary_USD"].to_numpy(), before["Salary_USD"].to_numpy())
+    assert np.shares_memory(
+        after["Experience_Years"].to_numpy(), before["Experience_Years"].to_numpy()
+    )
+    assert np.shares_memory(after["Department"].array.codes, before["Department"].array.codes)
+    # The previous version is left as it was
+    pd.testing.assert_frame_equal(before, HRDataset.build(sample_raw).store.frame)
+
+
+class _StaticSource:
+    def __init__(self, delta):
+        self.delta = delta
+
+    def load_delta(self, watermark):
+        return self.delta
+
+
+def test_refresh_of_unchanged_rows_keeps_the_dataset(sample_raw):
+    raw = sample_raw.assign(Ingestion_Timestamp=pd.Timestamp("2025-11-01"))
+    live = LiveDataset(HRDataset.build(raw))
+    swaps = []
+    live.subscribe(swaps.append)
+
+    # The watermark day is fetched again on every refresh
+    refresher = DatasetRefresher(live, _StaticSource(raw.iloc[:50]), interval_seconds=60)
+    assert not refresher.refresh_once()
+    assert swaps == [] and live.current.version == 0
+
+    changed = raw.iloc[:50].copy()
+    changed.loc[changed.index[7], "Status"] = "Moon"
+    refresher.source = _StaticSource(changed)
+    assert refresher.refresh_once()
+    assert live.current.version == 1
+    assert live.current.frame["Status"].iloc[7] == "Moon"
+    assert len(live.current.frame) == len(raw)
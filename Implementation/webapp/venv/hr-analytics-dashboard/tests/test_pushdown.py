@@ -0,0 +1,97 @@
+"""PushdownEngine SQL answers must match the in-memory HRCube on the same rows."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import assert_same
+from hr_dataset import HRDataset
+from pushdown import PushdownEngine
+
+pytestmark = pytest.mark.filterwarnings("ignore:Converting to PeriodArray")
+
+
+@pytest.fixture(scope="module")
+def dataset(sample_raw):
+    return HRDataset.build(sample_raw)
+
+
+@pytest.fixture(scope="module")
+def engine(sample_raw):
+    return PushdownEngine.for_sqlite(sample_raw)
+
+
+def assert_results_match(expected, actual):
+    """Compare query results: frames, tuples of them, or scalars."""
+    if isinstance(expected, tuple):
+        assert len(expected) == len(actual)
+        for expected_part, actual_part in zip(expected, actual):
+            assert_results_match(expected_part, actual_part)
+    elif isinstance(expected, pd.DataFrame):
+        assert list(expected.columns) == list(actual.columns)
+        assert_same(expected, actual)
+    else:
+        np.testing.assert_allclose(actual, expected, rtol=1e-9)
+
+
+def test_options_match(dataset, engine):
+    assert engine.options("Department") == dataset.departments
+    assert engine.options("Work_Mode") == dataset.work_modes
+
+
+def test_department_queries_match(dataset, engine):
+    cube = dataset.cube
+    for department in [None, "Nope", *dataset.departments]:
+        for method in ["summary", "salary_by_hire_year", "job_title_profile", "job_level_profile"]:
+            assert_results_match(
+                getattr(cube, method)(department), getattr(engine, method)(department)
+            )
+        for group_field in ["Department", "Job_Level"]:
+            expected = cube.turnover(group_field, department)
+            actual = engine.turnover(group_field, department)
+            assert actual[2] == expected[2]
+            if expected[2]:
+                assert_results_match(expected, actual)
+
+    assert_results_match(cube.salary_by_department(), engine.salary_by_department())
+
+
+def test_work_mode_queries_match(dataset, engine):
+    for work_mode in [None, "Nope", *dataset.work_modes]:
+        for group_field in ["Department", "Work_Mode"]:
+            assert_results_match(
+                dataset.cube.headcount(group_field, work_mode, name="Headcount"),
+                engine.headcount(group_field, work_mode, name="Headcount"),
+            )
+
+
+def test_experience_performance_points_match(dataset, engine):
+    keys = ["Experience_Years", "Performance_Rating"]
+    for department in [None, "Nope", *dataset.departments]:
+        rows = dataset.store.select([*keys, "Salary_USD"], Department=department)
+        expected = (
+            rows.dropna(subset=keys)
+            .astype("float64")
+            .groupby(keys)
+            # SQL SUM over only NULLs is NULL, not 0
+            .agg(
+                Count=("Salary_USD", "size"),
+                Salary_USD=("Salary_USD", lambda salary: salary.sum(min_count=1)),
+            )
+            .reset_index()
+        )
+        actual = engine.experience_performance_points(department).sort_values(keys)
+        assert_results_match(expected, actual)
+
+
+def test_first_employee_ignores_row_order(sample_raw):
+    # Rows out of employee_id order; a refresh moves some and appends others
+    shuffled = sample_raw.sample(frac=1, random_state=3).reset_index(drop=True)
+    moved = shuffled.iloc[:300].assign(Department="Legal")
+    dataset = HRDataset.build(shuffled.iloc[:-200])
+    dataset = dataset.apply_delta(pd.concat([moved, shuffled.iloc[-200:]]))
+    engine = PushdownEngine.for_sqlite(pd.concat([moved, shuffled.iloc[300:]]))
+    for department in [None, *dataset.departments]:
+        assert_results_match(
+            dataset.cube.job_title_profile(department), engine.job_title_profile(department)
+        )
@@ -0,0 +1,106 @@
+"""A worker attaching the published dataset must read the shared pages, not copies."""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_dataset import HRDataset
+from hr_store import INDEXED_DIMENSIONS
+from shared_dataset import (
+    AttachedDataset, PublishedDataset, SharedDatasetPublisher, _frame_from_table, _read_ipc, attach,
+)
+
+pytestmark = pytest.mark.filterwarnings("ignore:Converting to PeriodArray")
+
+
+def _data(values: pd.Series) -> np.ndarray:
+    """The array holding a column's values."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.array.codes
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        return values.array.asi8
+    return values.to_numpy()
+
+
+@pytest.fixture
+def publisher(tmp_path):
+    publisher = SharedDatasetPublisher(tmp_path)
+    yield publisher
+    publisher.close()
+
+
+@pytest.fixture
+def published(publisher, sample_raw):
+    dataset = HRDataset.build(sample_raw)
+    publisher.publish(dataset)
+    return dataset, publisher.path
+
+
+def _buffer(table, name: str) -> np.ndarray:
+    return np.frombuffer(table.column(name).chunk(0).buffers()[1], dtype=np.uint8)
+
+
+def test_attached_columns_view_the_file_buffers(published):
+    _, path = published
+    table = _read_ipc(path)
+    frame, _, index = _frame_from_table(table)
+    for col in frame.columns:
+        assert np.shares_memory(_data(frame[col]), _buffer(table, col)), col
+    # The row index is mapped too, not sorted again
+    for column, (order, _) in index.arrays().items():
+        assert np.shares_memory(order, _buffer(table, f"{column}__row_order")), column
+
+
+def test_attached_dataset_matches_published(published):
+    dataset, path = published
+    attached = attach(path)
+    expected = dataset.frame[attached.frame.columns]
+    pd.testing.assert_frame_equal(attached.frame, expected)
+    assert attached.departments == dataset.departments
+    assert attached.work_modes == dataset.work_modes
+    for column in INDEXED_DIMENSIONS:
+        for value in dataset.store.options(column):
+            np.testing.assert_array_equal(
+                attached.store.index.positions(column, value),
+                dataset.store.index.positions(column, value),
+            )
+
+
+def test_parent_keeps_only_the_mapped_copy(publisher, sample_raw):
+    dataset = HRDataset.build(sample_raw)
+    live = PublishedDataset(dataset, publisher)
+    for col in _read_ipc(publisher.path).column_names:
+        if col in dataset.frame.columns:
+            # Published columns now come from the file
+            assert not np.shares_memory(_data(live.current.frame[col]), _data(dataset.frame[col]))
+    pd.testing.assert_frame_equal(live.current.frame, dataset.frame)
+
+    # Refreshes merge into the mapped version and publish the result
+    delta = sample_raw.iloc[:3].assign(Work_Mode="Remote")
+    live.swap(live.current.apply_delta(delta))
+    expected = dataset.apply_delta(delta)
+    pd.testing.assert_frame_equal(live.current.frame, expected.frame)
+    assert attach(publisher.path).version == live.current.version == 1
+
+
+def test_republished_dataset_is_attached_off_the_request_thread(published, publisher, sample_raw):
+    dataset, path = published
+    live = AttachedDataset(path, poll_seconds=0.01)
+    swapped = threading.Event()
+    listener_threads = []
+
+    def listener(new):
+        listener_threads.append(threading.current_thread())
+        swapped.set()
+
+    live.subscribe(listener)
+    try:
+        publisher.publish(dataset.apply_delta(sample_raw.iloc[:3].assign(Work_Mode="Remote")))
+        assert swapped.wait(timeout=10)
+        assert live.current.version == 1
+        assert listener_threads == [listener_threads[0]]
+        assert listener_threads[0] is not threading.current_thread()
+    finally:
+        live.stop()